@@ -0,0 +1,73 @@
+"""
+Rows/sec of the movie list endpoint with and without FAST_RESPONSES.
+
+Both paths serve the same pages through the full application stack; the
+default path hydrates `Movie` entities and validates a `MoviePage`, the
+fast path fetches plain rows and encodes them directly. Usage:
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --limit 100 --requests 500 --path /api/v1/movies/filter?sort=rating
+
+Run it against a loaded dataset (python -m src.app.db.ingest).
+"""
+import argparse
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from fastapi.testclient import TestClient
+
+from main import app
+from src.app.api import movies, responses
+
+
+def _walk(client: TestClient, path: str, limit: int, requests: int) -> Tuple[int, float]:
+    """Request `requests` consecutive cursor pages, wrapping at the end; returns (rows, seconds)."""
+    separator = "&" if "?" in path else "?"
+    cursor, rows = None, 0
+    started = time.perf_counter()
+    for _ in range(requests):
+        url = f"{path}{separator}limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        response.raise_for_status()
+        page = response.json()
+        rows += len(page["items"])
+        cursor = page["next_cursor"]
+    return rows, time.perf_counter() - started
+
+
+def run(path: str, limit: int, requests: int) -> List[Tuple[str, float]]:
+    """(label, rows/sec) of the default and fast paths."""
+    results = []
+    with TestClient(app) as client:
+        for label, fast in (("validated models", False), ("fast rows", True)):
+            movies.FAST_RESPONSES = fast
+            _walk(client, path, limit, max(1, requests // 10))  # warm-up
+            rows, seconds = _walk(client, path, limit, requests)
+            if rows == 0:
+                raise SystemExit("No movies returned; load a dataset first (python -m src.app.db.ingest)")
+            results.append((label, rows / seconds))
+    movies.FAST_RESPONSES = responses.FAST_RESPONSES
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare rows/sec of the default and fast list serialization.")
+    parser.add_argument("--path", default="/api/v1/movies/", help="list endpoint to page through")
+    parser.add_argument("--limit", type=int, default=1000, help="rows per page")
+    parser.add_argument("--requests", type=int, default=100, help="pages requested per path")
+    args = parser.parse_args(argv)
+
+    results = run(args.path, args.limit, args.requests)
+    baseline = results[0][1]
+    encoder = "orjson" if responses.orjson is not None else "json"
+    print(f"{args.path} limit={args.limit} requests={args.requests} encoder={encoder}")
+    for label, rate in results:
+        print(f"  {label:<17} {rate:>12,.0f} rows/sec  x{rate / baseline:.2f}")
+    if responses.orjson is None:
+        print("orjson is not installed: the fast path encoded with the slower standard library json")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,38 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 import uvicorn
 from fastapi import FastAPI
 
+from src.app.api.health import router as health_router
+from src.app.api.metrics import record_request_latency, router as metrics_router
 from src.app.api.movies import router as movies_router
+from src.app.api.movies_async import router as movies_async_router
+from src.app.db import database
+from src.app.services.statistics_refresh import STATS_REFRESH_SECONDS, refresh_statistics_periodically
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await database.startup()
+    refresher = None
+    if STATS_REFRESH_SECONDS > 0:
+        refresher = asyncio.create_task(refresh_statistics_periodically(STATS_REFRESH_SECONDS))
+    yield
+    if refresher is not None:
+        refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresher
+    await database.shutdown()
 
 app = FastAPI(
     title="Movies API",
     description="REST API for managing movie information",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-app.include_router(movies_router)
\ No newline at end of file
+app.include_router(movies_router)
+app.include_router(movies_async_router)
+app.include_router(health_router)
+app.include_router(metrics_router)
+app.middleware("http")(record_request_latency)
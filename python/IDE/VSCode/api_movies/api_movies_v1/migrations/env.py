@@ -0,0 +1,73 @@
+"""
+Alembic environment for the Movies API.
+
+`create_tables()` runs migrations on the application's engine by passing
+a connection through `config.attributes`; the alembic CLI builds its own
+engine from DATABASE_URL.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+from sqlmodel import SQLModel
+
+import src.app.models.movie  # noqa: F401  (registers the tables on SQLModel.metadata)
+import src.app.repositories.search  # noqa: F401  (registers the full-text index listener)
+from src.app.db.database import DATABASE_URL
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("connection") is None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = SQLModel.metadata
+
+# Full-text index objects are raw DDL owned by repositories/search.py
+SEARCH_INDEX_PREFIX = "movie_fts"
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    return not (type_ == "table" and name is not None and name.startswith(SEARCH_INDEX_PREFIX))
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+        include_object=include_object,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run(connection) -> None:
+    # Batch mode lets ALTER-style operations work on SQLite as well
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=True,
+        include_object=include_object,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+    engine = create_engine(DATABASE_URL)
+    try:
+        with engine.connect() as connection:
+            _run(connection)
+    finally:
+        engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
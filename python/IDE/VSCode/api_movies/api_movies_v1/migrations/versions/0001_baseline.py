@@ -0,0 +1,47 @@
+"""Baseline schema
+
+Creates the movie table as it stood before migrations were introduced, when
+the app built it with `metadata.create_all`. Databases created that way
+should be marked with `alembic stamp 0001` and then upgraded.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "movie",
+        sa.Column("series_title", sa.String(), nullable=False),
+        sa.Column("released_year", sa.Integer(), nullable=True),
+        sa.Column("certificate", sa.String(), nullable=True),
+        sa.Column("runtime", sa.String(), nullable=True),
+        sa.Column("genre", sa.String(), nullable=True),
+        sa.Column("imdb_rating", sa.Float(), nullable=True),
+        sa.Column("overview", sa.String(), nullable=True),
+        sa.Column("director", sa.String(), nullable=True),
+        sa.Column("star1", sa.String(), nullable=True),
+        sa.Column("star2", sa.String(), nullable=True),
+        sa.Column("star3", sa.String(), nullable=True),
+        sa.Column("star4", sa.String(), nullable=True),
+        sa.Column("no_of_votes", sa.Integer(), nullable=True),
+        sa.Column("gross", sa.String(), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_movie_series_title", "movie", ["series_title"])
+    op.create_index("ix_movie_genre", "movie", ["genre"])
+
+
+def downgrade() -> None:
+    op.drop_table("movie")
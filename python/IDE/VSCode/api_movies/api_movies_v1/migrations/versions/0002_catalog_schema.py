@@ -0,0 +1,144 @@
+"""Catalog schema: derived columns, genre/cast tables, write tracking and search
+
+- movie.meta_score, and the columns MovieRepository derives from each row:
+  title_key (unique with released_year), runtime_minutes and gross_usd.
+- movie.version and movie.updated_at, the basis of per-movie ETags.
+- genre, person, movie_genre and movie_cast, normalized from the genre and
+  star columns.
+- catalog_state, the catalog-wide write counter, and
+  movie_statistics_snapshot.
+- The full-text search index.
+
+Existing rows are backfilled with the repository's own backfill methods,
+so they match rows written by the app. Stored movies whose titles differ
+only in case or spacing, with the same release year, would break the
+unique title/year index; the upgrade lists them and stops before changing
+anything, so merge or rename them and run it again.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlmodel import Session
+
+from src.app.models.movie import utcnow
+from src.app.repositories.movie_repository import MovieRepository
+from src.app.repositories.normalization import normalize_key
+from src.app.repositories.search import install_search_index, rebuild_search_index
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _title_year_duplicates(connection) -> list:
+    """(series_title, released_year) of stored movies that share a normalized title and year."""
+    seen, duplicates = set(), []
+    rows = connection.execute(sa.text("SELECT series_title, released_year FROM movie ORDER BY id"))
+    for title, year in rows:
+        if year is None:
+            continue
+        key = (normalize_key(title), year)
+        if key in seen:
+            duplicates.append((title, year))
+        seen.add(key)
+    return duplicates
+
+
+def upgrade() -> None:
+    # SQLite DDL isn't transactional here, so check before the first ALTER
+    duplicates = _title_year_duplicates(op.get_bind())
+    if duplicates:
+        listed = ", ".join(f"'{title}' ({year})" for title, year in duplicates[:10])
+        raise RuntimeError(f"Resolve {len(duplicates)} duplicate title/year movies before upgrading: {listed}")
+
+    with op.batch_alter_table("movie") as batch_op:
+        batch_op.add_column(sa.Column("meta_score", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("title_key", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("runtime_minutes", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("gross_usd", sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+        batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+    op.get_bind().execute(sa.text("UPDATE movie SET updated_at = :now"), {"now": utcnow()})
+    with op.batch_alter_table("movie") as batch_op:
+        batch_op.alter_column("updated_at", existing_type=sa.DateTime(), nullable=False)
+    op.create_index("uq_movie_title_key_released_year", "movie", ["title_key", "released_year"], unique=True)
+
+    for name in ("genre", "person"):
+        op.create_table(
+            name,
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("name_key", sa.String(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(f"ix_{name}_name_key", name, ["name_key"], unique=True)
+
+    op.create_table(
+        "movie_genre",
+        sa.Column("movie_id", sa.Integer(), nullable=False),
+        sa.Column("genre_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["movie_id"], ["movie.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["genre_id"], ["genre.id"]),
+        sa.PrimaryKeyConstraint("movie_id", "genre_id"),
+    )
+    op.create_index("ix_movie_genre_genre_id_movie_id", "movie_genre", ["genre_id", "movie_id"])
+
+    op.create_table(
+        "movie_cast",
+        sa.Column("movie_id", sa.Integer(), nullable=False),
+        sa.Column("person_id", sa.Integer(), nullable=False),
+        sa.Column("billing", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["movie_id"], ["movie.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["person_id"], ["person.id"]),
+        sa.PrimaryKeyConstraint("movie_id", "person_id"),
+    )
+    op.create_index("ix_movie_cast_person_id_movie_id", "movie_cast", ["person_id", "movie_id"])
+
+    catalog_state = op.create_table(
+        "catalog_state",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("generation", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(catalog_state, [{"id": 1, "generation": 0}])
+
+    op.create_table(
+        "movie_statistics_snapshot",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("generation", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    install_search_index(op.get_bind())
+
+    # The session joins the migration's transaction; its commits don't end it
+    with Session(bind=op.get_bind()) as session:
+        repository = MovieRepository(session)
+        repository.backfill_title_keys()
+        repository.backfill_numeric_fields()
+        repository.rebuild_genre_and_cast_links()
+        rebuild_search_index(session)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for trigger in ("movie_fts_ai", "movie_fts_ad", "movie_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS movie_fts")
+    else:
+        op.execute("DROP INDEX IF EXISTS ix_movie_search_vector")
+        op.execute("ALTER TABLE movie DROP COLUMN IF EXISTS search_vector")
+    for table in ("movie_statistics_snapshot", "catalog_state", "movie_cast", "movie_genre", "person", "genre"):
+        op.drop_table(table)
+    op.drop_index("uq_movie_title_key_released_year", table_name="movie")
+    with op.batch_alter_table("movie") as batch_op:
+        for column in ("updated_at", "version", "gross_usd", "runtime_minutes", "title_key", "meta_score"):
+            batch_op.drop_column(column)
@@ -0,0 +1,52 @@
+"""Indexes matching the repository's query shapes
+
+- (imdb_rating, id), partial on rated movies: get_top_rated_movies and the
+  BY_RATING keyset used by get_movies_by_rating_range and sort=rating.
+- (released_year, id): get_movies_by_year (year = ? ORDER BY id) and
+  get_recent_movies (released_year >= ? ORDER BY released_year DESC).
+- (runtime_minutes, id) and (gross_usd, id), partial on non-NULL values:
+  range filters plus the BY_RUNTIME / BY_GROSS keysets.
+- PostgreSQL only: a trigram GIN index on director for the ILIKE '%...%'
+  match in get_movies_by_director. No B-tree can serve that on SQLite.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# name -> (columns, partial-index predicate or None)
+COMPOSITE_INDEXES = {
+    "ix_movie_rating_id": (["imdb_rating", "id"], "imdb_rating IS NOT NULL"),
+    "ix_movie_released_year_id": (["released_year", "id"], None),
+    "ix_movie_runtime_minutes_id": (["runtime_minutes", "id"], "runtime_minutes IS NOT NULL"),
+    "ix_movie_gross_usd_id": (["gross_usd", "id"], "gross_usd IS NOT NULL"),
+}
+
+
+def upgrade() -> None:
+    for name, (columns, where) in COMPOSITE_INDEXES.items():
+        predicate = {"postgresql_where": sa.text(where), "sqlite_where": sa.text(where)} if where else {}
+        op.create_index(name, "movie", columns, **predicate)
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_movie_director_trgm", "movie", ["director"],
+            postgresql_using="gin", postgresql_ops={"director": "gin_trgm_ops"}
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_movie_director_trgm", table_name="movie")
+    for name in COMPOSITE_INDEXES:
+        op.drop_index(name, table_name="movie")
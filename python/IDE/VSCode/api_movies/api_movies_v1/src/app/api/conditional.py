@@ -0,0 +1,60 @@
+"""
+HTTP conditional GET helpers: ETags, If-None-Match and Last-Modified.
+
+A 304 is decided from a version number or the catalog generation alone,
+before the response body is loaded or serialized.
+"""
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+def movie_etag(movie_id: int, version: int) -> str:
+    """Strong ETag for one movie at one version."""
+    return f'"movie-{movie_id}-v{version}"'
+
+def catalog_etag(generation: int) -> str:
+    """Strong ETag for list and aggregate resources at one catalog generation."""
+    return f'"catalog-g{generation}"'
+
+def http_date(value: datetime) -> str:
+    """Format a naive-UTC or aware datetime as an HTTP date."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if If-None-Match lists `etag` (weak comparison, as RFC 9110 requires)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+def not_modified_since(request: Request, last_modified: Optional[datetime]) -> bool:
+    """True if If-Modified-Since is at or after `last_modified`; ignored when If-None-Match is sent."""
+    header = request.headers.get("if-modified-since")
+    if not header or last_modified is None or "if-none-match" in request.headers:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    modified = last_modified.replace(tzinfo=timezone.utc) if last_modified.tzinfo is None else last_modified
+    # HTTP dates have one-second resolution
+    return modified.replace(microsecond=0) <= since
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> dict:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+def not_modified(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """An empty 304 carrying the validators."""
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
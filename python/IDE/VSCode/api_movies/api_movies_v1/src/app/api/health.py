@@ -0,0 +1,15 @@
+from fastapi import APIRouter, HTTPException
+
+from ..db.database import engine_pool_status, test_connection
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+@router.get("/")
+def health_check():
+    if not test_connection():
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    return {"status": "ok"}
+
+@router.get("/pool")
+def get_pool_status():
+    return engine_pool_status()
@@ -1,15 +1,279 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
-from typing import List
+from typing import Iterator, List, Optional, Union
 
-from ..db.database import get_session
-from ..models.movie import Movie, MovieCreate, MovieRead, MovieUpdate
+from ..core.cache import LRUCache, QueryCache, SingleFlight
+from ..db.database import create_session, get_session
+from ..db.export import EXPORT_FORMATS
+from ..models.movie import (
+    Movie,
+    MovieBatchResult,
+    MovieBulkResult,
+    MovieBulkWriteResult,
+    MovieCreate,
+    MovieFacetedPage,
+    MoviePage,
+    MoviePatch,
+    MovieRead,
+    MovieSparsePage,
+    MovieUpdate,
+)
+from ..repositories.pagination import SORT_KEYSETS
+from ..repositories.projection import PROJECTABLE_FIELDS
 from ..services.movie_service import MovieService
+from .conditional import (
+    catalog_etag,
+    etag_matches,
+    movie_etag,
+    not_modified,
+    not_modified_since,
+    validator_headers,
+)
+from .responses import FAST_RESPONSES, page_response
 
 router = APIRouter(prefix="/api/v1/movies", tags=["movies-v1"])
 
+# Shared across requests so cached reads survive the per-request service
+movie_query_cache = QueryCache(LRUCache(max_entries=1024), ttl_seconds=30.0)
+# Concurrent cache misses for the same read share one database execution
+movie_single_flight = SingleFlight()
+
+FIELDS_DESCRIPTION = "Comma-separated fields to return, e.g. series_title,released_year,imdb_rating"
+
+def split_fields(fields: Optional[str]) -> Optional[List[str]]:
+    return fields.split(",") if fields is not None else None
+
+def page_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Requested fields; with FAST_RESPONSES every field is fetched as a plain row when none are named."""
+    if fields is None and FAST_RESPONSES:
+        return list(PROJECTABLE_FIELDS)
+    return split_fields(fields)
+
 def get_movie_service(session: Session = Depends(get_session)) -> MovieService:
-    return MovieService(session)
+    return MovieService(
+        session,
+        query_cache=movie_query_cache,
+        single_flight=movie_single_flight
+    )
+
+@router.get("/", response_model=Union[MoviePage, MovieSparsePage])
+def list_movies_v1(
+    request: Request,
+    response: Response,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    with_total: bool = Query(False, description="Include the number of matching movies"),
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    etag = catalog_etag(movie_service.get_catalog_generation())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        movies = movie_service.get_all_movies(
+            offset=offset, limit=limit, cursor=cursor, fields=page_fields(fields),
+            with_total=with_total
+        )
+        page = movie_service.build_page(movies, limit, fields=page_fields(fields), raw=FAST_RESPONSES)
+        return page_response(page, etag)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.get("/cache/stats")
+def get_cache_stats_v1(movie_service: MovieService = Depends(get_movie_service)):
+    return movie_service.cache_stats()
+
+@router.get("/search", response_model=Union[MoviePage, MovieSparsePage])
+def search_movies_v1(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=2, description="Free-text query over title and overview"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    with_total: bool = Query(False, description="Include the number of matching movies"),
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    etag = catalog_etag(movie_service.get_catalog_generation())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        movies = movie_service.search_movies(
+            q, offset=offset, limit=limit, cursor=cursor, fields=page_fields(fields),
+            with_total=with_total
+        )
+        page = movie_service.build_search_page(
+            movies, offset, limit, cursor, fields=page_fields(fields), raw=FAST_RESPONSES
+        )
+        return page_response(page, etag)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.get("/filter", response_model=Union[MoviePage, MovieSparsePage])
+def filter_movies_v1(
+    request: Request,
+    response: Response,
+    genre: Optional[str] = None,
+    year: Optional[int] = None,
+    min_rating: Optional[float] = None,
+    director: Optional[str] = None,
+    actor: Optional[str] = None,
+    min_runtime: Optional[int] = Query(None, ge=0, description="Minimum runtime in minutes"),
+    max_runtime: Optional[int] = Query(None, ge=0, description="Maximum runtime in minutes"),
+    min_gross: Optional[int] = Query(None, ge=0, description="Minimum gross in USD"),
+    max_gross: Optional[int] = Query(None, ge=0, description="Maximum gross in USD"),
+    sort: str = Query("id", pattern="^(id|rating|runtime|gross)$"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    with_total: bool = Query(False, description="Include the number of matching movies"),
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    etag = catalog_etag(movie_service.get_catalog_generation())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        movies = movie_service.get_movies_by_multiple_filters(
+            genre=genre,
+            year=year,
+            min_rating=min_rating,
+            director=director,
+            actor=actor,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            min_runtime=min_runtime,
+            max_runtime=max_runtime,
+            min_gross=min_gross,
+            max_gross=max_gross,
+            sort=sort,
+            fields=page_fields(fields),
+            with_total=with_total
+        )
+        page = movie_service.build_page(
+            movies, limit, SORT_KEYSETS[sort], page_fields(fields), raw=FAST_RESPONSES
+        )
+        return page_response(page, etag)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.get("/facets", response_model=MovieFacetedPage)
+def faceted_search_v1(
+    request: Request,
+    response: Response,
+    genre: Optional[str] = None,
+    year: Optional[int] = None,
+    min_rating: Optional[float] = None,
+    director: Optional[str] = None,
+    actor: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    generation = movie_service.get_catalog_generation()
+    etag = catalog_etag(generation)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        return movie_service.faceted_search(
+            genre=genre,
+            year=year,
+            min_rating=min_rating,
+            director=director,
+            actor=actor,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            generation=generation
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.get("/export")
+def export_movies_v1(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    genre: Optional[str] = None,
+    year: Optional[int] = None,
+    min_rating: Optional[float] = None,
+    director: Optional[str] = None,
+    actor: Optional[str] = None
+):
+    # The stream outlives the request-scoped session, so it gets its own
+    session = create_session()
+    try:
+        chunks = MovieService(session).export_movies(
+            export_format=export_format,
+            genre=genre,
+            year=year,
+            min_rating=min_rating,
+            director=director,
+            actor=actor
+        )
+    except ValueError as e:
+        session.close()
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return StreamingResponse(
+        _close_when_done(chunks, session),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="movies.{export_format}"'}
+    )
+
+def _close_when_done(chunks: Iterator[str], session: Session) -> Iterator[str]:
+    try:
+        yield from chunks
+    finally:
+        session.close()
+
+@router.get("/statistics")
+def get_movie_statistics_v1(
+    request: Request,
+    response: Response,
+    top_n: int = Query(5, ge=1, le=20, description="Movies listed per ranking"),
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    generation = movie_service.get_catalog_generation()
+    etag = catalog_etag(generation)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        return movie_service.get_movie_statistics(top_n, generation)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.get("/{movie_id}", response_model=MovieRead)
+def get_movie_v1(
+    movie_id: int,
+    request: Request,
+    response: Response,
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    try:
+        # Revalidation needs only the version, not the row
+        version = movie_service.get_movie_version(movie_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        etag = movie_etag(movie_id, version[0])
+        if etag_matches(request, etag) or not_modified_since(request, version[1]):
+            return not_modified(etag, version[1])
+        
+        movie = movie_service.get_movie_by_id(movie_id, version[0])
+        if movie is None:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        # Validators describe the body actually served
+        response.headers.update(validator_headers(movie_etag(movie.id, movie.version), movie.updated_at))
+        return movie
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 @router.post("/", response_model=MovieRead)
 def create_movie_v1(
@@ -21,3 +285,43 @@ def create_movie_v1(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     
+
+@router.post("/by-ids", response_model=MovieBatchResult)
+def get_movies_by_ids_v1(
+    movie_ids: List[int],
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    try:
+        return movie_service.get_movies_by_ids(movie_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.post("/bulk", response_model=MovieBulkResult)
+def bulk_import_movies_v1(
+    movies: List[MovieCreate],
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    try:
+        return movie_service.bulk_import_movies(movies)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.put("/bulk", response_model=MovieBulkWriteResult)
+def bulk_upsert_movies_v1(
+    movies: List[MovieCreate],
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    try:
+        return movie_service.bulk_upsert_movies(movies)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.patch("/bulk", response_model=MovieBulkWriteResult)
+def bulk_update_movies_v1(
+    patches: List[MoviePatch],
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    try:
+        return movie_service.bulk_update_movies(patches)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
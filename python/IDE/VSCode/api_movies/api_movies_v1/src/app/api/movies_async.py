@@ -0,0 +1,266 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional, Union
+
+from ..core.cache import AsyncSingleFlight
+from ..db.database import get_async_session
+from ..models.movie import (
+    MovieBatchResult,
+    MovieBulkResult,
+    MovieBulkWriteResult,
+    MovieCreate,
+    MovieFacetedPage,
+    MoviePage,
+    MoviePatch,
+    MovieRead,
+    MovieSparsePage,
+)
+from ..repositories.pagination import SORT_KEYSETS
+from ..services.async_movie_service import AsyncMovieService
+from .conditional import (
+    catalog_etag,
+    etag_matches,
+    movie_etag,
+    not_modified,
+    not_modified_since,
+    validator_headers,
+)
+from .movies import FIELDS_DESCRIPTION, movie_query_cache, split_fields
+
+# Mirrors the /api/v1 read and write routes except the streaming export,
+# which needs a synchronous session for the life of the response.
+router = APIRouter(prefix="/api/v2/movies", tags=["movies-v2"])
+
+# Threads can't wait on the event loop, so the async stack coalesces separately
+movie_async_single_flight = AsyncSingleFlight()
+
+def get_async_movie_service(session: AsyncSession = Depends(get_async_session)) -> AsyncMovieService:
+    return AsyncMovieService(
+        session,
+        query_cache=movie_query_cache,
+        single_flight=movie_async_single_flight
+    )
+
+@router.get("/", response_model=Union[MoviePage, MovieSparsePage])
+async def list_movies_v2(
+    request: Request,
+    response: Response,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    with_total: bool = Query(False, description="Include the number of matching movies"),
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    etag = catalog_etag(await movie_service.get_catalog_generation())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        movies = await movie_service.get_all_movies(
+            offset=offset, limit=limit, cursor=cursor, fields=split_fields(fields),
+            with_total=with_total
+        )
+        return movie_service.build_page(movies, limit, fields=split_fields(fields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.get("/cache/stats")
+async def get_cache_stats_v2(movie_service: AsyncMovieService = Depends(get_async_movie_service)):
+    return movie_service.cache_stats()
+
+@router.get("/search", response_model=Union[MoviePage, MovieSparsePage])
+async def search_movies_v2(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=2, description="Free-text query over title and overview"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    with_total: bool = Query(False, description="Include the number of matching movies"),
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    etag = catalog_etag(await movie_service.get_catalog_generation())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        movies = await movie_service.search_movies(
+            q, offset=offset, limit=limit, cursor=cursor, fields=split_fields(fields),
+            with_total=with_total
+        )
+        return movie_service.build_search_page(movies, offset, limit, cursor, fields=split_fields(fields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.get("/filter", response_model=Union[MoviePage, MovieSparsePage])
+async def filter_movies_v2(
+    request: Request,
+    response: Response,
+    genre: Optional[str] = None,
+    year: Optional[int] = None,
+    min_rating: Optional[float] = None,
+    director: Optional[str] = None,
+    actor: Optional[str] = None,
+    min_runtime: Optional[int] = Query(None, ge=0, description="Minimum runtime in minutes"),
+    max_runtime: Optional[int] = Query(None, ge=0, description="Maximum runtime in minutes"),
+    min_gross: Optional[int] = Query(None, ge=0, description="Minimum gross in USD"),
+    max_gross: Optional[int] = Query(None, ge=0, description="Maximum gross in USD"),
+    sort: str = Query("id", pattern="^(id|rating|runtime|gross)$"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    with_total: bool = Query(False, description="Include the number of matching movies"),
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    etag = catalog_etag(await movie_service.get_catalog_generation())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        movies = await movie_service.get_movies_by_multiple_filters(
+            genre=genre,
+            year=year,
+            min_rating=min_rating,
+            director=director,
+            actor=actor,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            min_runtime=min_runtime,
+            max_runtime=max_runtime,
+            min_gross=min_gross,
+            max_gross=max_gross,
+            sort=sort,
+            fields=split_fields(fields),
+            with_total=with_total
+        )
+        return movie_service.build_page(movies, limit, SORT_KEYSETS[sort], split_fields(fields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.get("/facets", response_model=MovieFacetedPage)
+async def faceted_search_v2(
+    request: Request,
+    response: Response,
+    genre: Optional[str] = None,
+    year: Optional[int] = None,
+    min_rating: Optional[float] = None,
+    director: Optional[str] = None,
+    actor: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    generation = await movie_service.get_catalog_generation()
+    etag = catalog_etag(generation)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        return await movie_service.faceted_search(
+            genre=genre,
+            year=year,
+            min_rating=min_rating,
+            director=director,
+            actor=actor,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            generation=generation
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.get("/statistics")
+async def get_movie_statistics_v2(
+    request: Request,
+    response: Response,
+    top_n: int = Query(5, ge=1, le=20, description="Movies listed per ranking"),
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    generation = await movie_service.get_catalog_generation()
+    etag = catalog_etag(generation)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        return await movie_service.get_movie_statistics(top_n, generation)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.get("/{movie_id}", response_model=MovieRead)
+async def get_movie_v2(
+    movie_id: int,
+    request: Request,
+    response: Response,
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    try:
+        version = await movie_service.get_movie_version(movie_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        etag = movie_etag(movie_id, version[0])
+        if etag_matches(request, etag) or not_modified_since(request, version[1]):
+            return not_modified(etag, version[1])
+        
+        movie = await movie_service.get_movie_by_id(movie_id, version[0])
+        if movie is None:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        response.headers.update(validator_headers(movie_etag(movie.id, movie.version), movie.updated_at))
+        return movie
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.post("/", response_model=MovieRead)
+async def create_movie_v2(
+    movie: MovieCreate,
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    try:
+        return await movie_service.create_movie(movie)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.post("/by-ids", response_model=MovieBatchResult)
+async def get_movies_by_ids_v2(
+    movie_ids: List[int],
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    try:
+        return await movie_service.get_movies_by_ids(movie_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.post("/bulk", response_model=MovieBulkResult)
+async def bulk_import_movies_v2(
+    movies: List[MovieCreate],
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    try:
+        return await movie_service.bulk_import_movies(movies)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.put("/bulk", response_model=MovieBulkWriteResult)
+async def bulk_upsert_movies_v2(
+    movies: List[MovieCreate],
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    try:
+        return await movie_service.bulk_upsert_movies(movies)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+@router.patch("/bulk", response_model=MovieBulkWriteResult)
+async def bulk_update_movies_v2(
+    patches: List[MoviePatch],
+    movie_service: AsyncMovieService = Depends(get_async_movie_service)
+):
+    try:
+        return await movie_service.bulk_update_movies(patches)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
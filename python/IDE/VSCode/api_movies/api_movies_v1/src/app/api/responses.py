@@ -0,0 +1,52 @@
+"""
+Fast JSON responses for movie listings.
+
+Enabled by setting FAST_RESPONSES=1: list pages are then fetched as plain
+rows and encoded straight to bytes, skipping the response-model
+validation FastAPI would otherwise repeat on data read from our own
+database. orjson is used when installed, the standard library otherwise.
+"""
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Union
+
+from fastapi import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+FAST_RESPONSES = os.getenv("FAST_RESPONSES", "").lower() in ("1", "true", "yes")
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode plain data (dicts, lists, scalars and datetimes) as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_json_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response whose content is already plain data and is encoded without validation."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def page_response(page: Union[BaseModel, Dict[str, Any]], etag: str) -> Union[BaseModel, Response]:
+    """Send a raw page as-is; model pages go through the route's response_model as usual."""
+    if isinstance(page, dict):
+        return FastJSONResponse(page, headers={"ETag": etag})
+    return page
@@ -0,0 +1 @@
+# core package
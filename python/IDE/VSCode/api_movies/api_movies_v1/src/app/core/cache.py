@@ -0,0 +1,247 @@
+"""
+Caching primitives shared across the Movies API.
+"""
+import asyncio
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .metrics import SINGLE_FLIGHT_CALLS
+
+
+def call_key(method: str, *args: Any, **kwargs: Any) -> str:
+    """Stable key for a call from the method name and normalized arguments."""
+    arguments = json.dumps([args, sorted(kwargs.items())], default=str, separators=(",", ":"))
+    return f"{method}:{arguments}"
+
+
+class CacheBackend(ABC):
+    """Storage interface for QueryCache; an external cache can implement it.
+
+    `get` returns None on a miss, so QueryCache wraps stored values.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def stats(self) -> Dict[str, int]:
+        """Backend-specific counters such as size and evictions."""
+        return {}
+
+
+class LRUCache(CacheBackend):
+    """In-process LRU cache with a per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class QueryCache:
+    """Read-through cache keyed on method name plus normalized arguments.
+
+    Keys embed a generation counter; writes call `bump_generation()` so
+    entries cached before the write are never served again and simply age
+    out of the backend. The counter only sees this process's writes, so
+    MovieService also keys catalog-wide reads on the database generation.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl_seconds: float = 30.0) -> None:
+        self.backend = backend or LRUCache()
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def make_key(self, method: str, *args: Any, **kwargs: Any) -> str:
+        """Build a stable key from the method name, arguments and generation."""
+        return f"{self.generation}:{call_key(method, *args, **kwargs)}"
+
+    def get_or_load(self, method: str, loader: Callable[[], Any], *args: Any, **kwargs: Any) -> Any:
+        """Return the cached result for the call, running `loader` on a miss."""
+        key = self.make_key(method, *args, **kwargs)
+        cached = self.backend.get(key)
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+            return cached[0]
+
+        with self._lock:
+            self.misses += 1
+        value = loader()
+        # A write during the load makes the result stale; don't store it
+        if key.startswith(f"{self.generation}:"):
+            self.backend.set(key, (value,), self.ttl_seconds)
+        return value
+
+    def bump_generation(self) -> None:
+        """Invalidate everything cached so far."""
+        with self._lock:
+            self.generation += 1
+
+    def clear(self) -> None:
+        self.bump_generation()
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            counters = {"hits": self.hits, "misses": self.misses, "generation": self.generation}
+        counters.update(self.backend.stats())
+        return counters
+
+
+class _Flight:
+    """One in-flight call that later callers wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls so that only one of them runs.
+
+    Callers arriving while a call with the same key is in flight block
+    until it finishes and receive its result (or its exception). Nothing is
+    kept afterwards: this deduplicates work in progress, it doesn't cache.
+    For threads; async code must use AsyncSingleFlight, since waiting here
+    would block the event loop.
+    """
+
+    def __init__(self) -> None:
+        self.executions = 0
+        self.coalesced = 0
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, loader: Callable[[], Any], operation: str = "other") -> Any:
+        """Run `loader` for `key`, or wait for the identical call already running."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+        SINGLE_FLIGHT_CALLS.inc(operation=operation, outcome="executed" if leader else "coalesced")
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._flights),
+            }
+
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines sharing one event loop."""
+
+    def __init__(self) -> None:
+        self.executions = 0
+        self.coalesced = 0
+        self._flights: Dict[str, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]], operation: str = "other") -> Any:
+        """Await `loader()` for `key`, or the identical call already running."""
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.coalesced += 1
+            SINGLE_FLIGHT_CALLS.inc(operation=operation, outcome="coalesced")
+            # Shielded so that a cancelled follower doesn't cancel the shared call
+            return await asyncio.shield(flight)
+
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+        self.executions += 1
+        SINGLE_FLIGHT_CALLS.inc(operation=operation, outcome="executed")
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            # Mark it retrieved: there may be no followers to await it
+            flight.exception()
+            raise
+        else:
+            flight.set_result(value)
+            return value
+        finally:
+            del self._flights[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights),
+        }
@@ -0,0 +1,290 @@
+"""
+In-process metrics for the Movies API, rendered in the Prometheus text format.
+
+Statement latency is recorded by SQLAlchemy engine events and tagged with
+the repository method that issued it, so a slow endpoint can be traced to
+the query responsible without an external profiler.
+"""
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Seconds; fine-grained at the low end where most indexed queries land
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Repository method currently issuing SQL; "other" for statements outside one
+current_operation: ContextVar[str] = ContextVar("current_operation", default="other")
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_SQL_CHARS = 1000
+
+slow_query_logger = logging.getLogger("movies.slow_query")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {value:g}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label set."""
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._series.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                labels = _format_labels(self.labelnames, key, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {total:.6f}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Owns the metrics and any collectors that report gauges on demand."""
+
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """Register a callable returning exposition lines, evaluated at scrape time."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+QUERY_LATENCY = registry.histogram(
+    "db_query_duration_seconds", "SQL statement latency by repository method.", ("operation", "statement")
+)
+QUERY_ROWS = registry.counter(
+    "db_query_rows_total", "Rows returned or affected by SQL statements.", ("operation", "statement")
+)
+SLOW_QUERIES = registry.counter(
+    "db_slow_queries_total", "Statements slower than SLOW_QUERY_MS.", ("operation",)
+)
+POOL_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection.", ("operation",)
+)
+SINGLE_FLIGHT_CALLS = registry.counter(
+    "single_flight_calls_total",
+    "Coalescable reads that executed, or joined an identical call already in flight.",
+    ("operation", "outcome")
+)
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route", "status")
+)
+
+
+def instrumented(cls):
+    """Class decorator tagging SQL issued by each public method with its name.
+
+    Nested calls keep the outermost method's tag, so helper calls are
+    attributed to the public operation that triggered them.
+    """
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(attribute):
+            continue
+        setattr(cls, name, _tag_operation(f"{cls.__name__}.{name}", attribute))
+    return cls
+
+
+def _tag_operation(operation: str, method: Callable) -> Callable:
+    if inspect.isgeneratorfunction(method):
+        return _tag_generator(operation, method)
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if current_operation.get() != "other":
+            return method(*args, **kwargs)
+        token = current_operation.set(operation)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            current_operation.reset(token)
+    return wrapper
+
+
+def _tag_generator(operation: str, method: Callable) -> Callable:
+    # Tag each step separately: a streaming response may resume the
+    # generator from a different thread and context on every step.
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        iterator = method(*args, **kwargs)
+        while True:
+            token = current_operation.set(operation) if current_operation.get() == "other" else None
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                if token is not None:
+                    current_operation.reset(token)
+            yield item
+    return wrapper
+
+
+def _statement_kind(statement: str) -> str:
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info["query_started"].pop()
+    elapsed = time.perf_counter() - started
+    operation = current_operation.get()
+    kind = _statement_kind(statement)
+    QUERY_LATENCY.observe(elapsed, operation=operation, statement=kind)
+    rowcount = getattr(cursor, "rowcount", -1)
+    if rowcount is not None and rowcount >= 0:
+        QUERY_ROWS.inc(rowcount, operation=operation, statement=kind)
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        SLOW_QUERIES.inc(operation=operation)
+        slow_query_logger.warning(json.dumps({
+            "event": "slow_query",
+            "operation": operation,
+            "duration_ms": round(elapsed * 1000, 3),
+            "rowcount": rowcount,
+            "executemany": executemany,
+            "statement": " ".join(statement.split())[:SLOW_QUERY_SQL_CHARS],
+        }))
+
+
+def _handle_error(exception_context) -> None:
+    # Drop the start time pushed for a statement that never completed
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach the latency, row count and slow-query hooks to a sync engine."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def observe_pool_wait(wait_seconds: float) -> None:
+    POOL_WAIT.observe(wait_seconds, operation=current_operation.get())
+
+
+def render_latest() -> str:
+    """Prometheus text exposition of every registered metric."""
+    return registry.render()
@@ -1,8 +1,30 @@
 """
 Database configuration and session management for the Movies API.
+
+Engine and pool settings are read from the environment (see
+`DatabaseSettings`); `startup` and `shutdown` are wired into the FastAPI
+lifespan in main.py. When DATABASE_REPLICA_URLS lists read replicas,
+sync sessions route reads to them (see `routing.RoutingSession`).
 """
+import asyncio
+import logging
 import os
-from sqlmodel import Session, SQLModel, create_engine
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from ..core.metrics import instrument_engine, observe_pool_wait, registry
+from .routing import REPLICA_STRATEGIES, ReplicaPool, RoutingSession
+
+logger = logging.getLogger(__name__)
 
 # Database URL
 DATABASE_URL = os.getenv(
@@ -10,17 +32,326 @@ DATABASE_URL = os.getenv(
     "postgresql://postgres:password@db:5432/moviesdb"
 )
 
+# Comma-separated read-replica URLs; reads are routed to them when set
+DATABASE_REPLICA_URLS = [
+    url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+]
+# How a session picks its replica: round_robin or least_connections
+DB_REPLICA_STRATEGY = os.getenv("DB_REPLICA_STRATEGY", REPLICA_STRATEGIES[0])
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """Engine and connection pool settings, read from DB_* environment variables."""
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_timeout_ms: int = 0
+    log_level: str = "WARNING"
+    warmup_connections: int = 5
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        pool_size = _env_int("DB_POOL_SIZE", cls.pool_size)
+        return cls(
+            pool_size=pool_size,
+            max_overflow=_env_int("DB_MAX_OVERFLOW", cls.max_overflow),
+            pool_timeout=_env_int("DB_POOL_TIMEOUT", cls.pool_timeout),
+            pool_recycle=_env_int("DB_POOL_RECYCLE", cls.pool_recycle),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", cls.pool_pre_ping),
+            statement_timeout_ms=_env_int("DB_STATEMENT_TIMEOUT_MS", cls.statement_timeout_ms),
+            log_level=os.getenv("DB_LOG_LEVEL", cls.log_level).upper(),
+            warmup_connections=min(_env_int("DB_POOL_WARMUP", pool_size), pool_size),
+        )
+
+    @property
+    def echo(self):
+        """SQLAlchemy `echo` value matching the configured log level."""
+        if self.log_level == "DEBUG":
+            return "debug"
+        return self.log_level == "INFO"
+
+class PoolMetrics:
+    """Checkout counters for one pool; wait time includes waiting for a free slot."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def record_error(self) -> None:
+        """Count a checkout that failed for another reason than pool exhaustion, e.g. a refused connect."""
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "checkout_errors": self.errors,
+                "checkout_wait_seconds_total": round(self.wait_seconds_total, 6),
+                "checkout_wait_seconds_max": round(self.wait_seconds_max, 6),
+                "checkout_wait_seconds_avg": round(
+                    self.wait_seconds_total / self.checkouts, 6
+                ) if self.checkouts else 0.0,
+            }
+
+class _TimedCheckout:
+    """Pool mixin that times how long each checkout waits for a connection."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        except Exception:
+            self.metrics.record_error()
+            raise
+        waited = time.perf_counter() - started
+        self.metrics.record(waited)
+        observe_pool_wait(waited)
+        return connection
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+def _is_memory_sqlite(url: str) -> bool:
+    return url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith(":"))
+
+def engine_options(url: str, settings: DatabaseSettings, is_async: bool = False) -> Dict[str, Any]:
+    """Keyword arguments for create_engine/create_async_engine."""
+    options: Dict[str, Any] = {"echo": settings.echo}
+    # In-memory SQLite needs its single-connection pool; sizing doesn't apply
+    if _is_memory_sqlite(url):
+        return options
+    options.update(
+        poolclass=TimedAsyncQueuePool if is_async else TimedQueuePool,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pool_pre_ping,
+    )
+    if settings.statement_timeout_ms and url.startswith("postgresql"):
+        if is_async:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(settings.statement_timeout_ms)}
+            }
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={settings.statement_timeout_ms}"}
+    return options
+
+def create_db_engine(url: str = DATABASE_URL, settings: Optional[DatabaseSettings] = None) -> Engine:
+    """Build the sync engine from `settings` (defaults to the environment)."""
+    settings = settings or DatabaseSettings.from_env()
+    logging.getLogger("sqlalchemy.engine").setLevel(settings.log_level)
+    db_engine = create_engine(url, **engine_options(url, settings))
+    instrument_engine(db_engine)
+    return db_engine
+
 # Create engine
-engine = create_engine(DATABASE_URL, echo=True)
+settings = DatabaseSettings.from_env()
+engine = create_db_engine(DATABASE_URL, settings)
+replica_pool = ReplicaPool(
+    [create_db_engine(url, settings) for url in DATABASE_REPLICA_URLS], DB_REPLICA_STRATEGY
+) if DATABASE_REPLICA_URLS else None
+
+def create_session() -> Session:
+    """Session on the primary, or a routing session when read replicas are configured.
+
+    Objects returned by INSERT/UPDATE ... RETURNING are already current, so
+    they aren't expired on commit, which would force a second SELECT per row.
+    """
+    if replica_pool is not None:
+        return RoutingSession(engine, replica_pool, expire_on_commit=False)
+    return Session(engine, expire_on_commit=False)
 
 # Get session dependency
+# A routing session lives for one request, so after a write the rest of
+# the request reads from the primary.
 def get_session():
-    with Session(engine) as session:
+    with create_session() as session:
         yield session
 
+# Async drivers used by the parallel async stack
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def async_database_url(url: str = DATABASE_URL) -> str:
+    """Rewrite a sync DATABASE_URL to the matching async driver."""
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+# Created on first use so the sync app doesn't require the async driver
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    url = os.getenv("ASYNC_DATABASE_URL", async_database_url())
+    async_engine = create_async_engine(url, **engine_options(url, settings, is_async=True))
+    instrument_engine(async_engine.sync_engine)
+    return async_engine
+
+# Get async session dependency
+async def get_async_session():
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        yield session
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """Current occupancy and checkout metrics of a pool."""
+    status: Dict[str, Any] = {"pool": pool.status()}
+    if isinstance(pool, QueuePool):
+        capacity = pool.size() + max(settings.max_overflow, 0)
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+            saturation=round(pool.checkedout() / capacity, 4) if capacity else 0.0,
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
+
+def engine_pool_status() -> Dict[str, Any]:
+    """Pool status of the sync engine and, once created, the async engine."""
+    status = {"sync": pool_status(engine.pool)}
+    if replica_pool is not None:
+        for index, replica in enumerate(replica_pool.engines):
+            status[f"replica{index}"] = pool_status(replica.pool)
+    if get_async_engine.cache_info().currsize:
+        status["async"] = pool_status(get_async_engine().sync_engine.pool)
+    return status
+
+_POOL_GAUGES = (
+    ("size", "db_pool_size", "Connections the pool keeps open."),
+    ("checked_out", "db_pool_checked_out", "Connections currently in use."),
+    ("overflow", "db_pool_overflow", "Connections open beyond the pool size."),
+    ("saturation", "db_pool_saturation", "Checked-out connections over pool size plus overflow."),
+    ("checkout_timeouts", "db_pool_checkout_timeouts_total", "Checkouts that timed out waiting for a free connection."),
+    ("checkout_errors", "db_pool_checkout_errors_total", "Checkouts that failed opening a connection."),
+)
+
+def _pool_metric_lines():
+    """Exposition lines for the pool gauges, labelled by engine."""
+    status = engine_pool_status()
+    for key, name, documentation in _POOL_GAUGES:
+        kind = "counter" if name.endswith("_total") else "gauge"
+        yield f"# HELP {name} {documentation}"
+        yield f"# TYPE {name} {kind}"
+        for engine_name, pool in status.items():
+            if key in pool:
+                yield f'{name}{{engine="{engine_name}"}} {pool[key]}'
+
+registry.add_collector(_pool_metric_lines)
+
+def warm_up_pool(connections: Optional[int] = None) -> int:
+    """Open `connections` pooled connections per sync engine up front so the first requests don't pay for them."""
+    count = settings.warmup_connections if connections is None else connections
+    engines = [engine] + (replica_pool.engines if replica_pool is not None else [])
+    opened = []
+    try:
+        for db_engine in engines:
+            for _ in range(count):
+                connection = db_engine.connect()
+                opened.append(connection)
+                connection.exec_driver_sql("SELECT 1")
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+async def warm_up_async_pool(connections: Optional[int] = None) -> int:
+    """Async counterpart of `warm_up_pool`."""
+    count = settings.warmup_connections if connections is None else connections
+    async_engine = get_async_engine()
+
+    async def ping():
+        async with async_engine.connect() as connection:
+            await connection.exec_driver_sql("SELECT 1")
+
+    await asyncio.gather(*(ping() for _ in range(count)))
+    return count
+
+def async_engine_configured() -> bool:
+    """True once the async engine exists or ASYNC_DATABASE_URL asks for it."""
+    return bool(os.getenv("ASYNC_DATABASE_URL")) or get_async_engine.cache_info().currsize > 0
+
+async def startup() -> None:
+    """Check connectivity and warm the pools; called from the app lifespan.
+
+    The async pool is warmed only when the async engine is configured, so a
+    sync-only deployment never loads the async driver.
+    """
+    opened = warm_up_pool()
+    opened_async = await warm_up_async_pool() if async_engine_configured() else 0
+    logger.info("Database pools warmed: %d sync, %d async connections", opened, opened_async)
+
+async def shutdown() -> None:
+    """Close every pooled connection; called from the app lifespan."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if replica_pool is not None:
+        replica_pool.dispose()
+    engine.dispose()
+
+# Alembic project (alembic.ini and migrations/) at the repository root
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
+
+def run_migrations(revision: str = "head") -> None:
+    """Upgrade the schema to `revision` on the application engine."""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "migrations"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
 # Create tables
 def create_tables():
-    SQLModel.metadata.create_all(engine)
+    run_migrations()
 
 # Test connection
 def test_connection():
@@ -0,0 +1,233 @@
+"""
+EXPLAIN every repository finder and flag sequential scans of catalog tables.
+
+Each finder runs once against the configured database with sample values
+taken from the data; the SELECT statements it issues are captured and
+explained with EXPLAIN QUERY PLAN on SQLite or EXPLAIN (FORMAT JSON) on
+PostgreSQL. Usage:
+
+    python -m src.app.db.explain
+    python -m src.app.db.explain --only get_movies_by_multiple_filters --verbose
+
+Run it against a representative dataset: on a near-empty table PostgreSQL
+rightly prefers a sequential scan to any index.
+"""
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlmodel import Session, select
+
+from ..models.movie import Genre, Movie, MovieCastLink, MovieGenreLink, Person
+from ..repositories.movie_repository import MovieRepository
+from ..repositories.pagination import BY_ID, next_cursor
+
+# Tables whose full scan grows with the catalog
+SCANNED_TABLES = frozenset(
+    model.__tablename__ for model in (Movie, Genre, Person, MovieGenreLink, MovieCastLink)
+)
+
+# Finders whose full scan is expected, with the reason shown in the report
+FULL_SCAN_EXPECTED = {
+    "compute_statistics": "aggregates the whole catalog",
+    "get_facet_counts:unfiltered": "aggregates the whole catalog",
+    "get_movies_count": "counts the whole catalog",
+    "count_movies:unfiltered": "counts the whole catalog",
+    "stream_movies:unfiltered": "exports the whole catalog",
+    "get_all_movies": "walks the primary key and stops at LIMIT",
+}
+# Substring matches need the pg_trgm index, which only PostgreSQL has
+SQLITE_FULL_SCAN_EXPECTED = {
+    "get_movies_by_director": "substring match; trigram-indexed on PostgreSQL",
+    "get_movies_by_multiple_filters:director": "substring match; trigram-indexed on PostgreSQL",
+}
+
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)(?! USING)")
+
+
+@dataclass
+class PlanReport:
+    """Plans of the statements issued by one finder call."""
+    finder: str
+    expected: Optional[str] = None
+    plans: List[Tuple[str, List[str]]] = field(default_factory=list)
+    scans: List[str] = field(default_factory=list)
+
+    @property
+    def flagged(self) -> bool:
+        return bool(self.scans) and self.expected is None
+
+
+def _sample_values(session: Session) -> Dict[str, Any]:
+    """Filter values that exist in the data, so plans reflect real lookups."""
+    movie = session.exec(
+        select(Movie)
+        .where(Movie.director.is_not(None), Movie.released_year.is_not(None), Movie.star1.is_not(None))
+        .order_by(Movie.id)
+        .limit(1)
+    ).first()
+    genre = session.exec(select(Genre.name).order_by(Genre.id).limit(1)).first()
+    first_page = session.exec(select(Movie).order_by(Movie.id).limit(10)).all()
+    if movie is None:
+        raise SystemExit("No movies to explain against; load a dataset first (python -m src.app.db.ingest)")
+    return {
+        "id": movie.id,
+        "title": movie.series_title,
+        "year": movie.released_year,
+        "director": movie.director,
+        "actor": movie.star1,
+        "genre": genre or "Drama",
+        "cursor": next_cursor(first_page, len(first_page), BY_ID),
+    }
+
+
+def finders(sample: Dict[str, Any]) -> List[Tuple[str, Callable[[MovieRepository], Any]]]:
+    """(name, call) for every read path of MovieRepository."""
+    return [
+        ("get_movie_by_id", lambda repo: repo.get_movie_by_id(sample["id"])),
+        ("get_movies_by_ids", lambda repo: repo.get_movies_by_ids(range(sample["id"] + 100, sample["id"] + 200))),
+        ("get_movie_version", lambda repo: repo.get_movie_version(sample["id"])),
+        ("get_catalog_generation", lambda repo: repo.get_catalog_generation()),
+        ("get_all_movies", lambda repo: repo.get_all_movies(limit=10)),
+        ("get_all_movies:cursor", lambda repo: repo.get_all_movies(
+            limit=10, cursor=sample["cursor"])),
+        ("search_movies", lambda repo: repo.search_movies(sample["title"].split()[0], limit=10)),
+        ("get_movies_by_genre", lambda repo: repo.get_movies_by_genre(sample["genre"], limit=10)),
+        ("get_movies_by_actor", lambda repo: repo.get_movies_by_actor(sample["actor"], limit=10)),
+        ("get_movies_by_year", lambda repo: repo.get_movies_by_year(sample["year"], limit=10)),
+        ("get_movies_by_director", lambda repo: repo.get_movies_by_director(sample["director"], limit=10)),
+        ("get_movies_by_rating_range", lambda repo: repo.get_movies_by_rating_range(8.0, 9.0, limit=10)),
+        ("get_top_rated_movies", lambda repo: repo.get_top_rated_movies(limit=10)),
+        ("get_recent_movies", lambda repo: repo.get_recent_movies(years_back=5, limit=10)),
+        ("get_movies_count", lambda repo: repo.get_movies_count()),
+        ("count_movies:unfiltered", lambda repo: repo.count_movies()),
+        ("count_movies", lambda repo: repo.count_movies(genre=sample["genre"], year=sample["year"])),
+        ("movie_exists_by_title_and_year", lambda repo: repo.movie_exists_by_title_and_year(
+            sample["title"], sample["year"])),
+        ("get_movies_by_multiple_filters", lambda repo: repo.get_movies_by_multiple_filters(
+            genre=sample["genre"], min_rating=7.0, limit=10)),
+        ("get_movies_by_multiple_filters:rating", lambda repo: repo.get_movies_by_multiple_filters(
+            min_rating=7.0, sort="rating", limit=10)),
+        ("get_movies_by_multiple_filters:runtime", lambda repo: repo.get_movies_by_multiple_filters(
+            min_runtime=90, max_runtime=150, sort="runtime", limit=10)),
+        ("get_movies_by_multiple_filters:gross", lambda repo: repo.get_movies_by_multiple_filters(
+            min_gross=1_000_000, sort="gross", limit=10)),
+        ("get_movies_by_multiple_filters:director", lambda repo: repo.get_movies_by_multiple_filters(
+            director=sample["director"], limit=10)),
+        ("get_facet_counts:unfiltered", lambda repo: repo.get_facet_counts()),
+        ("get_facet_counts", lambda repo: repo.get_facet_counts(year=sample["year"])),
+        ("compute_statistics", lambda repo: repo.compute_statistics()),
+        ("get_statistics_snapshot", lambda repo: repo.get_statistics_snapshot()),
+        ("stream_movies:unfiltered", lambda repo: list(repo.stream_movies(("id", "series_title")))),
+        ("stream_movies", lambda repo: list(repo.stream_movies(("id", "series_title"), year=sample["year"]))),
+    ]
+
+
+def _captured_selects(connection: Connection, call: Callable[[], Any]) -> List[Tuple[str, Any]]:
+    statements: List[Tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+    return statements
+
+
+def _sqlite_plan(connection: Connection, statement: str, parameters: Any) -> Tuple[List[str], List[str]]:
+    rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    lines, scans = [], []
+    for row in rows:
+        detail = row[-1]
+        lines.append(detail)
+        match = _SQLITE_SCAN.match(detail)
+        if match and match.group(1) in SCANNED_TABLES:
+            scans.append(detail)
+    return lines, scans
+
+
+def _postgres_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _postgres_nodes(child)
+
+
+def _postgres_plan(connection: Connection, statement: str, parameters: Any) -> Tuple[List[str], List[str]]:
+    document = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+    if isinstance(document, str):
+        document = json.loads(document)
+    lines, scans = [], []
+    for node in _postgres_nodes(document[0]["Plan"]):
+        relation = node.get("Relation Name")
+        index = node.get("Index Name")
+        line = node["Node Type"] + (f" on {relation}" if relation else "") + (f" using {index}" if index else "")
+        lines.append(line)
+        if node["Node Type"] == "Seq Scan" and relation in SCANNED_TABLES:
+            scans.append(line)
+    return lines, scans
+
+
+def explain_finders(session: Session, only: Optional[str] = None) -> List[PlanReport]:
+    """Run each finder inside a rolled-back transaction and explain what it issued."""
+    connection = session.connection()
+    is_sqlite = connection.dialect.name == "sqlite"
+    explain = _sqlite_plan if is_sqlite else _postgres_plan
+    expected = {**FULL_SCAN_EXPECTED, **(SQLITE_FULL_SCAN_EXPECTED if is_sqlite else {})}
+    repository = MovieRepository(session)
+    reports = []
+    for name, call in finders(_sample_values(session)):
+        if only and name.split(":")[0] != only:
+            continue
+        report = PlanReport(name, expected.get(name))
+        for statement, parameters in _captured_selects(connection, lambda: call(repository)):
+            lines, scans = explain(connection, statement, parameters)
+            report.plans.append((" ".join(statement.split()), lines))
+            report.scans.extend(scans)
+        reports.append(report)
+    session.rollback()
+    return reports
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="EXPLAIN every repository finder and flag sequential scans.")
+    parser.add_argument("--only", help="explain a single finder by method name")
+    parser.add_argument("--verbose", action="store_true", help="print the SQL and full plan of every statement")
+    parser.add_argument("--no-fail", action="store_true", help="exit 0 even when a sequential scan is flagged")
+    args = parser.parse_args(argv)
+
+    from .database import engine
+
+    with Session(engine) as session:
+        reports = explain_finders(session, only=args.only)
+
+    flagged = 0
+    for report in reports:
+        if report.flagged:
+            flagged += 1
+            print(f"SEQ SCAN  {report.finder}")
+            for scan in report.scans:
+                print(f"          {scan}")
+        elif report.scans:
+            print(f"scan ok   {report.finder} ({report.expected})")
+        else:
+            print(f"ok        {report.finder}")
+        if args.verbose:
+            for sql, lines in report.plans:
+                print(f"          {sql}")
+                for line in lines:
+                    print(f"            {line}")
+    print(f"{len(reports)} finders explained, {flagged} with sequential scans", file=sys.stderr)
+    return 1 if flagged and not args.no_fail else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
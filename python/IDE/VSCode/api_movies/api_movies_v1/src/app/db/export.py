@@ -0,0 +1,65 @@
+"""
+Streaming serializers for movie exports.
+
+Each serializer consumes row mappings lazily and yields text chunks, so an
+export can be sent with a StreamingResponse without materializing the
+result. CSV exports use the IMDb-style headers understood by `ingest`, so
+an export can be loaded back with `python -m src.app.db.ingest`.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Mapping
+
+from .ingest import CSV_COLUMNS
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Rows serialized per yielded chunk; small enough that the first chunk goes out at once
+ROWS_PER_CHUNK = 500
+
+
+def ndjson_chunks(rows: Iterable[Mapping[str, Any]], fields: List[str]) -> Iterator[str]:
+    """Yield newline-delimited JSON, one object per movie."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({name: row[name] for name in fields}, ensure_ascii=False, default=_json_default))
+        if len(lines) >= ROWS_PER_CHUNK:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def csv_chunks(rows: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    """Yield CSV text with an IMDb-style header row first."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    fields = [field_name for field_name, _ in CSV_COLUMNS.values()]
+    yield _drain(buffer)
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(["" if row[name] is None else row[name] for name in fields])
+        if count % ROWS_PER_CHUNK == 0:
+            yield _drain(buffer)
+    tail = _drain(buffer)
+    if tail:
+        yield tail
+
+
+def _drain(buffer: io.StringIO) -> str:
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return text
@@ -0,0 +1,130 @@
+"""
+Streaming CSV ingestion for IMDb-style movie dumps such as dataset/imdb_top_1000.csv.
+
+Rows are read one at a time and written in large chunks, so memory stays
+constant regardless of file size.
+
+Usage:
+    python -m src.app.db.ingest src/app/db/dataset/imdb_top_1000.csv --chunk-size 5000
+"""
+import argparse
+import csv
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+MAX_REPORTED_ERRORS = 100
+
+
+def _text(value: str) -> Optional[str]:
+    value = value.strip()
+    return value or None
+
+
+def _int(value: str) -> Optional[int]:
+    value = value.strip().replace(",", "")
+    return int(value) if value.isdigit() else None
+
+
+def _float(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+# CSV header -> MovieBase field and the parser applied to the raw text
+CSV_COLUMNS: Dict[str, Tuple[str, Callable[[str], object]]] = {
+    "Series_Title": ("series_title", _text),
+    "Released_Year": ("released_year", _int),
+    "Certificate": ("certificate", _text),
+    "Runtime": ("runtime", _text),
+    "Genre": ("genre", _text),
+    "IMDB_Rating": ("imdb_rating", _float),
+    "Meta_score": ("meta_score", _int),
+    "Overview": ("overview", _text),
+    "Director": ("director", _text),
+    "Star1": ("star1", _text),
+    "Star2": ("star2", _text),
+    "Star3": ("star3", _text),
+    "Star4": ("star4", _text),
+    "No_of_Votes": ("no_of_votes", _int),
+    "Gross": ("gross", _text),
+}
+
+
+@dataclass
+class IngestReport:
+    """Outcome of a CSV import."""
+    rows_read: int = 0
+    rows_inserted: int = 0
+    rows_rejected: int = 0
+    elapsed_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_inserted / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def reject(self, line_number: int, reason: str) -> None:
+        self.rows_rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"line {line_number}: {reason}")
+
+    def summary(self) -> str:
+        return (
+            f"{self.rows_inserted} movies loaded, {self.rows_rejected} rejected "
+            f"in {self.elapsed_seconds:.2f}s ({self.rows_per_second:,.0f} rows/s)"
+        )
+
+
+def map_record(record: Dict[str, str]) -> Dict[str, object]:
+    """Map one CSV record onto MovieCreate field values; unknown columns are ignored."""
+    values = {}
+    for column, (field_name, parse) in CSV_COLUMNS.items():
+        raw = record.get(column)
+        values[field_name] = parse(raw) if raw is not None else None
+    return values
+
+
+def read_movie_csv(path: str) -> Iterator[Tuple[int, Dict[str, object]]]:
+    """Yield (line_number, field values) for each record without loading the file."""
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        reader = csv.DictReader(handle)
+        missing = {"Series_Title"} - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"CSV file is missing required columns: {', '.join(sorted(missing))}")
+        for record in reader:
+            yield reader.line_num, map_record(record)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load a movies CSV into the database.")
+    parser.add_argument("path", help="CSV file with IMDb-style headers (Series_Title, Released_Year, ...)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="rows written per statement batch")
+    parser.add_argument("--create-tables", action="store_true", help="migrate the schema to the latest revision first")
+    args = parser.parse_args(argv)
+
+    from sqlmodel import Session
+    from .database import create_tables, engine
+    from ..services.movie_service import MovieService
+
+    if args.create_tables:
+        create_tables()
+
+    def progress(report: IngestReport) -> None:
+        print(f"... {report.rows_inserted} rows ({report.rows_per_second:,.0f} rows/s)", file=sys.stderr)
+
+    with Session(engine) as session:
+        report = MovieService(session).import_movies_csv(
+            args.path, chunk_size=args.chunk_size, on_progress=progress
+        )
+
+    print(report.summary())
+    for error in report.errors:
+        print(f"  {error}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
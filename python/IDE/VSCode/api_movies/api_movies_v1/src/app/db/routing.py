@@ -0,0 +1,85 @@
+"""
+Read/write session routing for read-replica databases.
+
+`RoutingSession` sends plain SELECTs to a replica chosen from a
+`ReplicaPool` and everything else to the primary. Once a session has
+written, its remaining reads go to the primary too, so a request reads
+its own writes despite replication lag. A session keeps the replica it
+picked first, so its reads never go back in time by switching replicas.
+"""
+import itertools
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Engine
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.selectable import CompoundSelect, Select
+from sqlmodel import Session
+
+REPLICA_STRATEGIES = ("round_robin", "least_connections")
+
+
+def _checked_out(replica: Engine) -> int:
+    pool = replica.pool
+    return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+
+class ReplicaPool:
+    """Read-replica engines and the policy that picks one for a session."""
+
+    def __init__(self, engines: Sequence[Engine], strategy: str = "round_robin") -> None:
+        if not engines:
+            raise ValueError("A replica pool needs at least one engine")
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(f"Unknown replica strategy {strategy!r}; expected one of {', '.join(REPLICA_STRATEGIES)}")
+        self.engines = list(engines)
+        self.strategy = strategy
+        # next() on itertools.count is atomic, so no lock is needed across threads
+        self._turn = itertools.count()
+
+    def choose(self) -> Engine:
+        """Next replica in turn, or the one with the fewest checked-out connections."""
+        start = next(self._turn) % len(self.engines)
+        if self.strategy == "round_robin":
+            return self.engines[start]
+        # Rotating the candidates spreads ties instead of always picking the first replica
+        rotated = self.engines[start:] + self.engines[:start]
+        return min(rotated, key=_checked_out)
+
+    def dispose(self) -> None:
+        for replica in self.engines:
+            replica.dispose()
+
+
+def is_replica_read(clause: Any) -> bool:
+    """True for SELECTs a replica can answer; locking reads and all other statements need the primary."""
+    if isinstance(clause, Select):
+        return clause._for_update_arg is None
+    return isinstance(clause, CompoundSelect)
+
+
+class RoutingSession(Session):
+    """Session that reads from a replica and writes to the primary, then reads its writes."""
+
+    def __init__(self, primary: Engine, replicas: ReplicaPool, **kwargs: Any) -> None:
+        super().__init__(bind=primary, **kwargs)
+        self.primary = primary
+        self.replicas = replicas
+        self.replica: Optional[Engine] = None
+        self.wrote = False
+
+    def use_primary(self) -> None:
+        """Send every later statement of this session to the primary."""
+        self.wrote = True
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs: Any) -> Engine:
+        if bind is not None:
+            return bind
+        if self._flushing or (clause is not None and not is_replica_read(clause)):
+            self.wrote = True
+            return self.primary
+        # No statement (e.g. dialect lookups or session.connection()) means the primary
+        if self.wrote or clause is None:
+            return self.primary
+        if self.replica is None:
+            self.replica = self.replicas.choose()
+        return self.replica
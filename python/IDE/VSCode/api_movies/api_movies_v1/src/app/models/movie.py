@@ -1,6 +1,12 @@
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from sqlalchemy import DDL, JSON, BigInteger, Column, Index, event, text
 from sqlmodel import SQLModel, Field
 
+def utcnow() -> datetime:
+    """Naive UTC timestamp, the form every supported backend round-trips."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 class MovieBase(SQLModel):
     series_title: str = Field(index=True)
     released_year: Optional[int] = None
@@ -8,6 +14,7 @@ class MovieBase(SQLModel):
     runtime: Optional[str] = None
     genre: Optional[str] = Field(index=True)
     imdb_rating: Optional[float] = None
+    meta_score: Optional[int] = None
     overview: Optional[str] = None
     director: Optional[str] = None
     star1: Optional[str] = None
@@ -17,14 +24,130 @@ class MovieBase(SQLModel):
     no_of_votes: Optional[int] = None
     gross: Optional[str] = None
 
+def _partial_index(name: str, column: str) -> Index:
+    """(column, id) index over rows where `column` is set, for keyset sorts on it."""
+    where = text(f"{column} IS NOT NULL")
+    return Index(name, column, "id", postgresql_where=where, sqlite_where=where)
+
 class Movie(MovieBase, table=True):
+    __table_args__ = (
+        Index("uq_movie_title_key_released_year", "title_key", "released_year", unique=True),
+        # Query-shape indexes; created by migration 0003, which documents each one
+        _partial_index("ix_movie_rating_id", "imdb_rating"),
+        Index("ix_movie_released_year_id", "released_year", "id"),
+        _partial_index("ix_movie_runtime_minutes_id", "runtime_minutes"),
+        _partial_index("ix_movie_gross_usd_id", "gross_usd"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
+    # Case-folded, whitespace-collapsed series_title maintained by MovieRepository
+    title_key: Optional[str] = None
+    # runtime and gross parsed to integers by MovieRepository, for indexed range queries
+    runtime_minutes: Optional[int] = None
+    gross_usd: Optional[int] = Field(default=None, sa_type=BigInteger)
+    # Bumped by every MovieRepository write; the basis of per-movie ETags
+    version: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
+    updated_at: datetime = Field(default_factory=utcnow)
+
+class CatalogState(SQLModel, table=True):
+    """Single-row table whose generation changes with every write to the catalog.
+
+    List and statistics ETags are derived from it, so every worker process
+    sees the same value.
+    """
+    __tablename__ = "catalog_state"
+
+    id: int = Field(default=1, primary_key=True)
+    generation: int = 0
+
+event.listen(
+    CatalogState.__table__,
+    "after_create",
+    DDL("INSERT INTO catalog_state (id, generation) VALUES (1, 0)")
+)
+
+class MovieStatisticsSnapshot(SQLModel, table=True):
+    """Materialized statistics payload, valid while `generation` matches CatalogState."""
+    __tablename__ = "movie_statistics_snapshot"
+
+    id: int = Field(default=1, primary_key=True)
+    generation: int
+    computed_at: datetime = Field(default_factory=utcnow)
+    payload: Dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+
+class Genre(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    name_key: str = Field(unique=True, index=True)
+
+class Person(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    name_key: str = Field(unique=True, index=True)
+
+class MovieGenreLink(SQLModel, table=True):
+    __tablename__ = "movie_genre"
+    __table_args__ = (Index("ix_movie_genre_genre_id_movie_id", "genre_id", "movie_id"),)
+
+    movie_id: int = Field(foreign_key="movie.id", primary_key=True, ondelete="CASCADE")
+    genre_id: int = Field(foreign_key="genre.id", primary_key=True)
+
+class MovieCastLink(SQLModel, table=True):
+    __tablename__ = "movie_cast"
+    __table_args__ = (Index("ix_movie_cast_person_id_movie_id", "person_id", "movie_id"),)
+
+    movie_id: int = Field(foreign_key="movie.id", primary_key=True, ondelete="CASCADE")
+    person_id: int = Field(foreign_key="person.id", primary_key=True)
+    billing: int = 1
 
 class MovieCreate(MovieBase):
     pass
 
 class MovieRead(MovieBase):
     id: int
+    runtime_minutes: Optional[int] = None
+    gross_usd: Optional[int] = None
+    version: int = 1
+    updated_at: Optional[datetime] = None
+
+class MoviePage(SQLModel):
+    items: List[MovieRead]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+class MovieBatchResult(SQLModel):
+    items: List[MovieRead]
+    missing_ids: List[int] = []
+
+class MovieSparsePage(SQLModel):
+    """Page of the `fields=` subset of each movie; `id` is always present."""
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+class MovieFacetValue(SQLModel):
+    value: str
+    count: int
+
+class MovieFacets(SQLModel):
+    genre: List[MovieFacetValue] = []
+    decade: List[MovieFacetValue] = []
+    certificate: List[MovieFacetValue] = []
+    rating: List[MovieFacetValue] = []
+
+class MovieFacetedPage(MoviePage):
+    total: int
+    facets: MovieFacets
+
+class MovieConflict(SQLModel):
+    index: int
+    series_title: str
+    released_year: Optional[int] = None
+    reason: str
+
+class MovieBulkResult(SQLModel):
+    created: List[MovieRead]
+    conflicts: List[MovieConflict]
 
 class MovieUpdate(SQLModel):
     series_title: Optional[str] = None
@@ -33,6 +156,7 @@ class MovieUpdate(SQLModel):
     runtime: Optional[str] = None
     genre: Optional[str] = None
     imdb_rating: Optional[float] = None
+    meta_score: Optional[int] = None
     overview: Optional[str] = None
     director: Optional[str] = None
     star1: Optional[str] = None
@@ -41,3 +165,10 @@ class MovieUpdate(SQLModel):
     star4: Optional[str] = None
     no_of_votes: Optional[int] = None
     gross: Optional[str] = None
+
+class MoviePatch(MovieUpdate):
+    id: int
+
+class MovieBulkWriteResult(SQLModel):
+    affected: int
+    missing_ids: List[int] = []
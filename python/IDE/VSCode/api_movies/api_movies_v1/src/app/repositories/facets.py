@@ -0,0 +1,87 @@
+"""
+Facet counts for filtered movie listings, computed in a single SQL round-trip.
+
+Each facet is counted over the current filters minus the facet's own
+filter, so the UI can show how many results every alternative value would
+return. All facets are branches of one UNION ALL with the shape
+(facet, value, n).
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Integer, String, cast, literal, null, true, union_all
+from sqlmodel import and_, func, select
+
+from ..models.movie import Genre, Movie, MovieGenreLink
+
+FACETS = ("genre", "decade", "certificate", "rating")
+
+# Facet -> the filter argument it replaces; facets without one see every filter
+FACET_FILTERS = {"genre": "genre", "decade": "year", "rating": "min_rating"}
+
+UNKNOWN_VALUE = "unknown"
+
+
+def _row(facet: str, value, n) -> list:
+    return [
+        literal(facet, String).label("facet"),
+        cast(value if value is not None else null(), String).label("value"),
+        cast(n, Integer).label("n"),
+    ]
+
+
+def facet_statement(conditions_for: Callable[[Optional[str]], list]):
+    """Build the UNION ALL of the total and every facet's grouped counts.
+
+    `conditions_for(facet)` returns the WHERE conditions for one facet;
+    `conditions_for(None)` returns the full filter set for the total.
+    """
+    def where(facet: Optional[str]):
+        conditions = conditions_for(facet)
+        return and_(*conditions) if conditions else true()
+
+    decade = Movie.released_year // 10 * 10
+    # Whole-star buckets: floor first, since casting a float to an integer rounds on PostgreSQL
+    rating = cast(func.floor(Movie.imdb_rating), Integer)
+    return union_all(
+        select(*_row("total", None, func.count())).select_from(Movie).where(where(None)),
+        select(*_row("genre", Genre.name, func.count()))
+        .select_from(Movie)
+        .join(MovieGenreLink, MovieGenreLink.movie_id == Movie.id)
+        .join(Genre, Genre.id == MovieGenreLink.genre_id)
+        .where(where("genre"))
+        .group_by(Genre.id, Genre.name),
+        select(*_row("decade", decade, func.count()))
+        .where(where("decade"))
+        .group_by(decade),
+        select(*_row("certificate", Movie.certificate, func.count()))
+        .where(where("certificate"))
+        .group_by(Movie.certificate),
+        select(*_row("rating", rating, func.count()))
+        .where(and_(where("rating"), Movie.imdb_rating.is_not(None)))
+        .group_by(rating),
+    )
+
+
+def _numeric_order(item: Tuple[str, int]):
+    value = item[0]
+    return (0, int(value)) if value.lstrip("-").isdigit() else (1, 0)
+
+
+def fold_facets(rows: Iterable[Any]) -> Tuple[int, Dict[str, List[Tuple[str, int]]]]:
+    """Return (total, facet -> [(value, count)]) from facet rows.
+
+    Genre and certificate values are ordered by count, decades and rating
+    buckets by value.
+    """
+    total = 0
+    facets: Dict[str, List[Tuple[str, int]]] = {facet: [] for facet in FACETS}
+    for row in rows:
+        if row.facet == "total":
+            total = row.n
+        else:
+            facets[row.facet].append((row.value if row.value is not None else UNKNOWN_VALUE, row.n))
+    for facet in ("genre", "certificate"):
+        facets[facet].sort(key=lambda item: (-item[1], item[0]))
+    for facet in ("decade", "rating"):
+        facets[facet].sort(key=_numeric_order)
+    return total, facets
@@ -1,102 +1,279 @@
-from typing import List, Optional
-from sqlmodel import Session, select, and_, or_
-from ..models.movie import Movie, MovieCreate, MovieUpdate
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
+from sqlalchemy import bindparam, delete, insert, inspect, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select, and_, func
+from ..core.metrics import instrumented
+from ..db.routing import RoutingSession
+from ..models.movie import (
+    CatalogState,
+    Genre,
+    Movie,
+    MovieCastLink,
+    MovieCreate,
+    MovieGenreLink,
+    MovieStatisticsSnapshot,
+    MovieUpdate,
+    Person,
+    utcnow,
+)
+from .facets import FACET_FILTERS, facet_statement, fold_facets
+from .normalization import normalize_key, parse_gross_usd, parse_runtime_minutes, split_genres
+from .pagination import (
+    BY_ID,
+    BY_RATING,
+    RELEVANCE,
+    SORT_KEYSETS,
+    Keyset,
+    decode_cursor,
+    decode_offset_cursor,
+    keyset_order,
+    keyset_predicate,
+    next_offset_cursor,
+)
+from .projection import projection_columns
+from .search import ranked_search
+from .statistics import fold_statistics, statistics_statement
 
+CAST_FIELDS = ("star1", "star2", "star3", "star4")
+LINKED_FIELDS = ("genre",) + CAST_FIELDS
+
+# Upper bound on bound parameters in a single IN (...) list
+IN_CLAUSE_CHUNK = 1000
+
+
+# Paginated finders return (rows, total) when called with with_total=True
+FinderResult = Union[List[Movie], Tuple[List[Movie], int]]
+
+
+class DuplicateMovieError(ValueError):
+    """Raised when a write would violate the unique (title_key, released_year) index."""
+
+
+@instrumented
 class MovieRepository:
     def __init__(self, session: Session) -> None:
         self.session = session
 
+    def use_primary(self) -> None:
+        """Read from the primary from now on; call before reads that decide a write.
+
+        A lagging replica could otherwise miss rows a conflict check must see.
+        """
+        if isinstance(self.session, RoutingSession):
+            self.session.use_primary()
+
     def create_movie(self, movie_data: MovieCreate) -> Movie:
-        """Create a new movie record."""
-        movie_dict = movie_data.model_dump()
-        db_movie = Movie(**movie_dict)
-        self.session.add(db_movie)
+        """Create a new movie record with a single INSERT ... RETURNING."""
+        movie_dict = self._with_derived_fields(movie_data.model_dump())
+        with self._unique_title_year():
+            db_movie = self.session.scalars(insert(Movie).returning(Movie), [movie_dict]).one()
+        self._sync_links([db_movie], replace=False)
+        self._touch_catalog()
         self.session.commit()
-        self.session.refresh(db_movie)
         return db_movie
 
     def get_movie_by_id(self, movie_id: int) -> Optional[Movie]:
         """Get a movie by its ID."""
         return self.session.get(Movie, movie_id)
    
-    def get_all_movies(self, offset: int = 0, limit: int = 10) -> List[Movie]:
+    def get_movies_by_ids(self, movie_ids: Sequence[int]) -> Dict[int, Movie]:
+        """Get movies by id, keyed by id; ids that don't exist are absent.
+
+        Movies already loaded in this session are taken from the identity
+        map; the rest are fetched with one IN query per IN_CLAUSE_CHUNK ids.
+        """
+        mapper = inspect(Movie)
+        found: Dict[int, Movie] = {}
+        to_fetch: List[int] = []
+        for movie_id in dict.fromkeys(movie_ids):
+            movie = self.session.identity_map.get(mapper.identity_key_from_primary_key((movie_id,)))
+            if movie is not None and not inspect(movie).expired_attributes:
+                found[movie_id] = movie
+            else:
+                to_fetch.append(movie_id)
+        
+        for start in range(0, len(to_fetch), IN_CLAUSE_CHUNK):
+            chunk = to_fetch[start:start + IN_CLAUSE_CHUNK]
+            found.update(
+                (movie.id, movie) for movie in self.session.exec(select(Movie).where(Movie.id.in_(chunk)))
+            )
+        return found
+
+    def get_movie_version(self, movie_id: int) -> Optional[Tuple[int, datetime]]:
+        """Get only a movie's (version, updated_at), or None if it doesn't exist."""
+        row = self.session.exec(
+            select(Movie.version, Movie.updated_at).where(Movie.id == movie_id)
+        ).one_or_none()
+        return tuple(row) if row is not None else None
+
+    def get_catalog_generation(self) -> int:
+        """Get the counter that changes with every write to the catalog."""
+        generation = self.session.exec(
+            select(CatalogState.generation).where(CatalogState.id == 1)
+        ).one_or_none()
+        return generation or 0
+   
+    def get_all_movies(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
         """Get all movies with pagination."""
-        result = self.session.exec(
-            select(Movie).offset(offset).limit(limit)
-        )
-        return list(result.all())
+        return self._find(select(Movie), offset, limit, cursor, fields=fields, with_total=with_total)
 
     def update_movie(self, movie_id: int, movie_update: MovieUpdate) -> Optional[Movie]:
-        """Update an existing movie."""
-        db_movie = self.get_movie_by_id(movie_id)
-        if not db_movie:
-            return None
+        """Update an existing movie with a single UPDATE ... RETURNING."""
+        update_data = self._with_derived_fields(movie_update.model_dump(exclude_unset=True))
+        if not update_data:
+            return self.get_movie_by_id(movie_id)
         
-        update_data = movie_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_movie, field, value)
+        with self._unique_title_year():
+            db_movie = self.session.scalars(
+                update(Movie)
+                .where(Movie.id == movie_id)
+                .values(**update_data, version=Movie.version + 1, updated_at=utcnow())
+                .returning(Movie)
+                .execution_options(populate_existing=True)
+            ).one_or_none()
+        if db_movie is None:
+            return None
 
+        if any(field in update_data for field in LINKED_FIELDS):
+            self._sync_links([db_movie])
+        self._touch_catalog()
         self.session.commit()
-        self.session.refresh(db_movie)
         return db_movie
 
     def delete_movie(self, movie_id: int) -> bool:
         """Delete a movie by ID."""
-        db_movie = self.get_movie_by_id(movie_id)
-        if not db_movie:
-            return False
-        
-        self.session.delete(db_movie)
+        self._delete_links([movie_id])
+        deleted_id = self.session.scalars(
+            delete(Movie).where(Movie.id == movie_id).returning(Movie.id)
+        ).one_or_none()
+        if deleted_id is not None:
+            self._touch_catalog()
         self.session.commit()
-        return True
+        return deleted_id is not None
 
-    def search_movies(self, query: str, offset: int = 0, limit: int = 10) -> List[Movie]:
-        """Search movies by title or overview."""
-        result = self.session.exec(
-            select(Movie).where(
-                or_(
-                    Movie.series_title.ilike(f"%{query}%"),
-                    Movie.overview.ilike(f"%{query}%")
-                )
-            ).offset(offset).limit(limit)
-        )
-        return list(result.all())
+    def search_movies(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
+        """Full-text search over title and overview, most relevant first."""
+        dialect_name = self.session.get_bind().dialect.name
+        statement, order_by = ranked_search(dialect_name, query)
+        if fields:
+            statement = statement.with_only_columns(*projection_columns(fields, BY_ID))
+        if cursor:
+            offset = decode_offset_cursor(cursor, RELEVANCE)
+        
+        page = statement.order_by(*order_by).offset(offset).limit(limit)
+        if with_total:
+            # FTS5 ranking functions such as bm25() can't share a query with a window function
+            return self._fetch_with_total(statement, page, fields, windowed=dialect_name != "sqlite")
+        return self._fetch(page, fields)
 
-    def get_movies_by_genre(self, genre: str, offset: int = 0, limit: int = 10) -> List[Movie]:
+    def next_search_cursor(
+        self,
+        movies: List[Movie],
+        offset: int,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> Optional[str]:
+        """Cursor for the search page following `movies`, or None on the last page."""
+        return next_offset_cursor(movies, offset, limit, RELEVANCE, cursor)
+
+    def get_movies_by_genre(
+        self,
+        genre: str,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
         """Get movies filtered by genre."""
-        result = self.session.exec(
-            select(Movie).where(Movie.genre.ilike(f"%{genre}%"))
-            .offset(offset).limit(limit)
+        return self._find(
+            select(Movie).where(self._genre_condition(genre)),
+            offset, limit, cursor, fields=fields, with_total=with_total
         )
-        return list(result.all())
 
-    def get_movies_by_year(self, year: int, offset: int = 0, limit: int = 10) -> List[Movie]:
+    def get_movies_by_actor(
+        self,
+        actor: str,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
+        """Get the filmography of an actor billed in star1..star4."""
+        return self._find(
+            select(Movie).where(self._actor_condition(actor)),
+            offset, limit, cursor, fields=fields, with_total=with_total
+        )
+
+    def get_movies_by_year(
+        self,
+        year: int,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
         """Get movies filtered by release year."""
-        result = self.session.exec(
-            select(Movie).where(Movie.released_year == year)
-            .offset(offset).limit(limit)
+        return self._find(
+            select(Movie).where(Movie.released_year == year),
+            offset, limit, cursor, fields=fields, with_total=with_total
         )
-        return list(result.all())
 
-    def get_movies_by_director(self, director: str, offset: int = 0, limit: int = 10) -> List[Movie]:
+    def get_movies_by_director(
+        self,
+        director: str,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
         """Get movies filtered by director."""
-        result = self.session.exec(
-            select(Movie).where(Movie.director.ilike(f"%{director}%"))
-            .offset(offset).limit(limit)
+        return self._find(
+            select(Movie).where(Movie.director.ilike(f"%{director}%")),
+            offset, limit, cursor, fields=fields, with_total=with_total
         )
-        return list(result.all())
 
-    def get_movies_by_rating_range(self, min_rating: float, max_rating: float, offset: int = 0, limit: int = 10) -> List[Movie]:
-        """Get movies within a specific IMDB rating range."""
-        result = self.session.exec(
+    def get_movies_by_rating_range(
+        self,
+        min_rating: float,
+        max_rating: float,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
+        """Get movies within a specific IMDB rating range, highest rated first."""
+        return self._find(
             select(Movie).where(
                 and_(
                     Movie.imdb_rating >= min_rating,
                     Movie.imdb_rating <= max_rating
                 )
-            ).offset(offset).limit(limit)
+            ),
+            offset, limit, cursor, keyset=BY_RATING, fields=fields, with_total=with_total
         )
-        return list(result.all())
 
     def get_top_rated_movies(self, limit: int = 10) -> List[Movie]:
         """Get top rated movies."""
@@ -109,50 +286,189 @@ class MovieRepository:
 
     def get_movies_count(self) -> int:
         """Get total count of movies."""
-        result = self.session.exec(select(Movie))
-        return len(list(result.all()))
+        return self.session.exec(select(func.count()).select_from(Movie)).one()
+
+    def count_movies(
+        self,
+        genre: Optional[str] = None,
+        year: Optional[int] = None,
+        director: Optional[str] = None,
+        min_rating: Optional[float] = None,
+        max_rating: Optional[float] = None,
+        actor: Optional[str] = None
+    ) -> int:
+        """Count movies matching the same filters as the finders."""
+        query = select(func.count()).select_from(Movie)
+        conditions = self._filter_conditions(
+            genre=genre,
+            year=year,
+            director=director,
+            min_rating=min_rating,
+            max_rating=max_rating,
+            actor=actor
+        )
+        if conditions:
+            query = query.where(and_(*conditions))
+        return self.session.exec(query).one()
 
     def movie_exists_by_title_and_year(self, title: str, year: Optional[int] = None) -> bool:
-        """Check if a movie exists by title and optionally year."""
-        query = select(Movie).where(Movie.series_title.ilike(f"%{title}%"))
+        """Check if a movie exists by normalized title and optionally year."""
+        query = select(Movie.id).where(Movie.title_key == normalize_key(title))
         if year:
             query = query.where(Movie.released_year == year)
         
-        result = self.session.exec(query)
+        result = self.session.exec(query.limit(1))
         return result.first() is not None
 
+    def find_existing_title_years(
+        self,
+        title_years: Iterable[Tuple[str, Optional[int]]]
+    ) -> Set[Tuple[str, Optional[int]]]:
+        """Return which normalized (title, year) pairs already exist, in one query per chunk.
+
+        A pair with no year matches the title in any year, as in
+        `movie_exists_by_title_and_year`.
+        """
+        title_years = list(title_years)
+        title_column = Movie.title_key
+        dated = sorted({pair for pair in title_years if pair[1] is not None})
+        undated = sorted({title for title, year in title_years if year is None})
+        existing: Set[Tuple[str, Optional[int]]] = set()
+        
+        step = IN_CLAUSE_CHUNK // 2
+        for start in range(0, len(dated), step):
+            chunk = dated[start:start + step]
+            existing.update(self.session.exec(
+                select(title_column, Movie.released_year)
+                .where(tuple_(title_column, Movie.released_year).in_(chunk))
+            ).all())
+        for start in range(0, len(undated), IN_CLAUSE_CHUNK):
+            chunk = undated[start:start + IN_CLAUSE_CHUNK]
+            existing.update(
+                (title, None) for title in self.session.exec(
+                    select(title_column).where(title_column.in_(chunk)).distinct()
+                ).all()
+            )
+        return existing
+
+    def get_facet_counts(
+        self,
+        genre: Optional[str] = None,
+        year: Optional[int] = None,
+        min_rating: Optional[float] = None,
+        director: Optional[str] = None,
+        actor: Optional[str] = None
+    ) -> Tuple[int, Dict[str, List[Tuple[str, int]]]]:
+        """Count matches per genre, decade, certificate and rating bucket in one query.
+
+        Returns the total matching every filter and, per facet, (value, count)
+        pairs computed without that facet's own filter.
+        """
+        filters = {"genre": genre, "year": year, "min_rating": min_rating, "director": director, "actor": actor}
+        
+        def conditions_for(facet: Optional[str]) -> list:
+            excluded = FACET_FILTERS.get(facet)
+            return self._filter_conditions(**{name: value for name, value in filters.items() if name != excluded})
+        
+        return fold_facets(self.session.execute(facet_statement(conditions_for)).all())
+
+    def compute_statistics(self, top_n: int = 5, recent_years: int = 1) -> Dict[str, Any]:
+        """Compute catalog statistics with one UNION ALL query."""
+        since_year = datetime.now().year - recent_years
+        rows = self.session.execute(statistics_statement(top_n, since_year)).all()
+        return fold_statistics(rows)
+
+    def get_statistics_snapshot(self) -> Optional[MovieStatisticsSnapshot]:
+        """Get the materialized statistics row, if one has been saved."""
+        return self.session.get(MovieStatisticsSnapshot, 1, populate_existing=True)
+
+    def save_statistics_snapshot(self, generation: int, payload: Dict[str, Any]) -> None:
+        """Replace the materialized statistics with a payload computed at `generation`."""
+        table = MovieStatisticsSnapshot.__table__
+        statement = self._dialect_insert(table)
+        values = {"id": 1, "generation": generation, "computed_at": utcnow(), "payload": payload}
+        self.session.execute(
+            statement.values(values).on_conflict_do_update(
+                index_elements=[table.c.id],
+                set_={column: statement.excluded[column] for column in ("generation", "computed_at", "payload")}
+            )
+        )
+        self.session.commit()
+
     def get_movies_by_multiple_filters(
         self, 
         genre: Optional[str] = None,
         year: Optional[int] = None,
         min_rating: Optional[float] = None,
         director: Optional[str] = None,
+        actor: Optional[str] = None,
         offset: int = 0,
-        limit: int = 10
-    ) -> List[Movie]:
-        """Get movies with multiple filters applied."""
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        min_runtime: Optional[int] = None,
+        max_runtime: Optional[int] = None,
+        min_gross: Optional[int] = None,
+        max_gross: Optional[int] = None,
+        sort: str = BY_ID.name,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
+        """Get movies with multiple filters applied, ordered by one of SORT_KEYSETS."""
+        keyset = SORT_KEYSETS[sort]
         query = select(Movie)
         
-        conditions = []
-        if genre:
-            conditions.append(Movie.genre.ilike(f"%{genre}%"))
-        if year:
-            conditions.append(Movie.released_year == year)
-        if min_rating:
-            conditions.append(Movie.imdb_rating >= min_rating)
-        if director:
-            conditions.append(Movie.director.ilike(f"%{director}%"))
+        conditions = self._filter_conditions(
+            genre=genre,
+            year=year,
+            director=director,
+            min_rating=min_rating,
+            actor=actor,
+            min_runtime=min_runtime,
+            max_runtime=max_runtime,
+            min_gross=min_gross,
+            max_gross=max_gross
+        )
+        # Keyset predicates can't step over NULL sort keys
+        if keyset is not BY_ID:
+            conditions.append(getattr(Movie, keyset.fields[0]).is_not(None))
+        if conditions:
+            query = query.where(and_(*conditions))
         
+        return self._find(query, offset, limit, cursor, keyset=keyset, fields=fields, with_total=with_total)
+
+    def stream_movies(
+        self,
+        fields: Sequence[str],
+        genre: Optional[str] = None,
+        year: Optional[int] = None,
+        min_rating: Optional[float] = None,
+        director: Optional[str] = None,
+        actor: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Mapping[str, Any]]:
+        """Yield filtered movies in id order as plain row mappings, `batch_size` rows at a time.
+
+        Rows are fetched with `yield_per` (a server-side cursor where the driver
+        supports one) and bypass the identity map, so memory stays flat however
+        many rows match.
+        """
+        query = select(*(Movie.__table__.c[name] for name in fields))
+        conditions = self._filter_conditions(
+            genre=genre,
+            year=year,
+            director=director,
+            min_rating=min_rating,
+            actor=actor
+        )
         if conditions:
             query = query.where(and_(*conditions))
+        query = query.order_by(Movie.id).execution_options(yield_per=batch_size)
         
-        query = query.offset(offset).limit(limit)
-        result = self.session.exec(query)
-        return list(result.all())
+        for partition in self.session.execute(query).mappings().partitions():
+            yield from partition
 
     def get_recent_movies(self, years_back: int = 5, limit: int = 10) -> List[Movie]:
         """Get recent movies from the last N years."""
-        from datetime import datetime
         current_year = datetime.now().year
         min_year = current_year - years_back
         
@@ -164,17 +480,428 @@ class MovieRepository:
         return list(result.all())
 
     def bulk_create_movies(self, movies_data: List[MovieCreate]) -> List[Movie]:
-        """Create multiple movies in bulk."""
-        db_movies = []
+        """Create multiple movies in bulk with one multi-row INSERT ... RETURNING."""
+        rows = [self._with_derived_fields(movie_data.model_dump()) for movie_data in movies_data]
+        with self._unique_title_year():
+            db_movies = sorted(
+                self.session.scalars(insert(Movie).returning(Movie), rows).all(),
+                key=lambda movie: movie.id
+            )
+        self._sync_links(db_movies, replace=False)
+        self._touch_catalog()
+        self.session.commit()
+        return db_movies
+
+    def insert_movie_rows(self, rows: List[dict]) -> int:
+        """Insert plain field dicts as one executemany batch without building ORM objects."""
+        if not rows:
+            return 0
+        
+        table = Movie.__table__
+        with self._unique_title_year():
+            inserted = self.session.execute(
+                insert(table).returning(table.c.id, table.c.genre, *(table.c[field] for field in CAST_FIELDS)),
+                [self._with_derived_fields(dict(row)) for row in rows]
+            ).all()
+        self._sync_links(inserted, replace=False)
+        self._touch_catalog()
+        self.session.commit()
+        return len(inserted)
+
+    def bulk_upsert_movies(self, movies_data: List[MovieCreate]) -> int:
+        """Insert or update movies keyed on (title_key, released_year) in one transaction.
+
+        Rows are written with batched INSERT ... ON CONFLICT DO UPDATE
+        statements. An update sets only the fields the client sent, so
+        omitted fields keep their stored values; rows sending the same
+        fields share one statement. Returns the number of rows inserted or updated.
+        """
+        if not movies_data:
+            return 0
+        
+        groups: Dict[Tuple[str, ...], List[dict]] = {}
         for movie_data in movies_data:
-            movie_dict = movie_data.model_dump()
-            db_movie = Movie(**movie_dict)
-            self.session.add(db_movie)
-            db_movies.append(db_movie)
+            values = self._with_derived_fields(movie_data.model_dump(exclude_unset=True))
+            values.setdefault("released_year", movie_data.released_year)
+            groups.setdefault(tuple(sorted(values)), []).append(values)
         
+        affected = 0
+        for fields, rows in groups.items():
+            statement = self._upsert_statement(fields)
+            for start in range(0, len(rows), IN_CLAUSE_CHUNK):
+                written = self.session.execute(statement, rows[start:start + IN_CLAUSE_CHUNK]).all()
+                self._sync_links(written)
+                affected += len(written)
+        self._touch_catalog()
         self.session.commit()
-        for db_movie in db_movies:
-            self.session.refresh(db_movie)
+        return affected
+
+    def _upsert_statement(self, fields: Sequence[str]):
+        """INSERT ... ON CONFLICT (title_key, released_year) DO UPDATE of `fields` only."""
+        table = Movie.__table__
+        statement = self._dialect_insert(table)
+        key = ("title_key", "released_year")
+        return statement.on_conflict_do_update(
+            index_elements=[table.c[column] for column in key],
+            set_={
+                **{column: statement.excluded[column] for column in fields if column not in key},
+                "version": table.c.version + 1,
+                "updated_at": statement.excluded.updated_at,
+            }
+        ).returning(table.c.id, table.c.genre, *(table.c[field] for field in CAST_FIELDS))
+
+    def bulk_update_movies(self, patches: List[Tuple[int, dict]]) -> Tuple[int, List[int]]:
+        """Apply partial updates keyed by id in one transaction.
+
+        Patches that set the same columns share one executemany UPDATE.
+        Returns the number of rows updated and the ids that do not exist.
+        """
+        ids = [movie_id for movie_id, _ in patches]
+        existing = self._existing_ids(ids)
+        missing_ids = [movie_id for movie_id in ids if movie_id not in existing]
         
-        return db_movies
+        table = Movie.__table__
+        groups: Dict[Tuple[str, ...], List[dict]] = {}
+        relinked: List[int] = []
+        for movie_id, values in patches:
+            if movie_id not in existing or not values:
+                continue
+            values = self._with_derived_fields(dict(values))
+            params = {f"p_{field}": value for field, value in values.items()}
+            params["p_id"] = movie_id
+            groups.setdefault(tuple(sorted(values)), []).append(params)
+            if any(field in values for field in LINKED_FIELDS):
+                relinked.append(movie_id)
+        
+        now = utcnow()
+        with self._unique_title_year():
+            for fields, params in groups.items():
+                self.session.execute(
+                    table.update()
+                    .where(table.c.id == bindparam("p_id"))
+                    .values(
+                        {field: bindparam(f"p_{field}") for field in fields},
+                    )
+                    .values(version=table.c.version + 1, updated_at=now),
+                    params
+                )
+        
+        for start in range(0, len(relinked), IN_CLAUSE_CHUNK):
+            chunk = relinked[start:start + IN_CLAUSE_CHUNK]
+            self._sync_links(self.session.execute(
+                select(table.c.id, table.c.genre, *(table.c[field] for field in CAST_FIELDS))
+                .where(table.c.id.in_(chunk))
+            ).all())
+        if groups:
+            self._touch_catalog()
+        self.session.commit()
+        
+        # Patched rows may be loaded in this session with stale values
+        self.session.expire_all()
+        return sum(len(params) for params in groups.values()), missing_ids
+
+    def backfill_title_keys(self, batch_size: int = 1000) -> int:
+        """Fill title_key for rows written before it existed; returns rows updated."""
+        updated = 0
+        while True:
+            rows = self.session.exec(
+                select(Movie.id, Movie.series_title).where(Movie.title_key.is_(None)).limit(batch_size)
+            ).all()
+            if not rows:
+                return updated
+            with self._unique_title_year():
+                self.session.execute(
+                    Movie.__table__.update().where(Movie.__table__.c.id == bindparam("movie_id")),
+                    [{"movie_id": movie_id, "title_key": normalize_key(title)} for movie_id, title in rows]
+                )
+            self.session.commit()
+            updated += len(rows)
+
+    def backfill_numeric_fields(self, batch_size: int = 1000) -> int:
+        """Fill runtime_minutes and gross_usd for rows written before they existed; returns rows updated."""
+        table = Movie.__table__
+        updated = 0
+        last_id = 0
+        while True:
+            rows = self.session.exec(
+                select(Movie.id, Movie.runtime, Movie.gross)
+                .where(Movie.id > last_id)
+                .order_by(Movie.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                return updated
+            self.session.execute(
+                table.update()
+                .where(table.c.id == bindparam("movie_id"))
+                .values(runtime_minutes=bindparam("p_runtime"), gross_usd=bindparam("p_gross")),
+                [
+                    {"movie_id": movie_id, "p_runtime": parse_runtime_minutes(runtime), "p_gross": parse_gross_usd(gross)}
+                    for movie_id, runtime, gross in rows
+                ]
+            )
+            self.session.commit()
+            updated += len(rows)
+            last_id = rows[-1][0]
+
+    def _touch_catalog(self) -> None:
+        """Advance the catalog generation inside the current write transaction."""
+        table = CatalogState.__table__
+        self.session.execute(
+            table.update().where(table.c.id == 1).values(generation=table.c.generation + 1)
+        )
+
+    def _existing_ids(self, movie_ids: List[int]) -> Set[int]:
+        """Return which of the ids exist, chunking long id lists."""
+        existing: Set[int] = set()
+        for start in range(0, len(movie_ids), IN_CLAUSE_CHUNK):
+            chunk = movie_ids[start:start + IN_CLAUSE_CHUNK]
+            existing.update(self.session.exec(select(Movie.id).where(Movie.id.in_(chunk))).all())
+        return existing
+
+    def _dialect_insert(self, table):
+        """INSERT construct supporting ON CONFLICT for the bound dialect."""
+        dialect_name = self.session.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            return postgresql.insert(table)
+        if dialect_name == "sqlite":
+            return sqlite.insert(table)
+        raise NotImplementedError(f"Upserts are not supported on {dialect_name}")
+
+    def _with_derived_fields(self, values: dict) -> dict:
+        """Add the columns the repository derives from user-supplied fields."""
+        if values.get("series_title") is not None:
+            values["title_key"] = normalize_key(values["series_title"])
+        if "runtime" in values:
+            values["runtime_minutes"] = parse_runtime_minutes(values["runtime"])
+        if "gross" in values:
+            values["gross_usd"] = parse_gross_usd(values["gross"])
+        return values
+
+    @contextmanager
+    def _unique_title_year(self):
+        """Translate unique-index violations on (title_key, released_year)."""
+        try:
+            yield
+        except IntegrityError as e:
+            self.session.rollback()
+            if "title_key" not in str(e.orig):
+                raise
+            raise DuplicateMovieError("A movie with this title and year already exists") from e
+
+    def _paginate(
+        self,
+        query,
+        offset: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        keyset: Keyset = BY_ID,
+        fields: Optional[Sequence[str]] = None
+    ):
+        """Order a finder query by its keyset and apply offset or cursor paging.
+
+        With `fields`, only those columns (plus the sort key) are selected and
+        the finder returns lightweight rows instead of `Movie` entities.
+        """
+        if fields:
+            query = query.with_only_columns(*projection_columns(fields, keyset))
+        columns = [getattr(Movie, field) for field in keyset.fields]
+        if cursor:
+            values = decode_cursor(cursor, keyset)
+            query = query.where(keyset_predicate(columns, values, keyset))
+        else:
+            query = query.offset(offset)
+        return query.order_by(*keyset_order(columns, keyset)).limit(limit)
+
+    def _fetch(self, query, fields: Optional[Sequence[str]] = None) -> list:
+        """Run a finder query: `Movie` entities, or plain rows when it was projected."""
+        if fields:
+            return list(self.session.execute(query).all())
+        return list(self.session.exec(query).all())
+
+    def _find(
+        self,
+        query,
+        offset: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        keyset: Keyset = BY_ID,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
+        """Paginate and run a finder query, optionally with its total."""
+        page = self._paginate(query, offset, limit, cursor, keyset=keyset, fields=fields)
+        if with_total:
+            # A keyset page's seek predicate would narrow the COUNT(*) OVER () window
+            return self._fetch_with_total(query, page, fields, windowed=not cursor)
+        return self._fetch(page, fields)
+
+    def _fetch_with_total(
+        self,
+        query,
+        page,
+        fields: Optional[Sequence[str]] = None,
+        windowed: bool = True
+    ) -> Tuple[list, int]:
+        """Run `page` and count every row matching the unpaginated `query` in the same statement.
+
+        COUNT(*) OVER () is evaluated before LIMIT/OFFSET, so it sees the whole
+        filtered set. When `page` adds conditions of its own, `windowed=False`
+        attaches an uncorrelated scalar count subquery over `query` instead.
+        """
+        count_query = query.with_only_columns(func.count(), maintain_column_froms=True).order_by(None)
+        total = func.count().over() if windowed else count_query.correlate(None).scalar_subquery()
+        rows = self.session.execute(page.add_columns(total.label("total_count"))).all()
+        # A page past the end carries no rows to read the total from
+        count = rows[0].total_count if rows else self.session.execute(count_query).scalar_one()
+        return (list(rows) if fields else [row[0] for row in rows]), count
+
+    def _filter_conditions(
+        self,
+        genre: Optional[str] = None,
+        year: Optional[int] = None,
+        director: Optional[str] = None,
+        min_rating: Optional[float] = None,
+        max_rating: Optional[float] = None,
+        actor: Optional[str] = None,
+        min_runtime: Optional[int] = None,
+        max_runtime: Optional[int] = None,
+        min_gross: Optional[int] = None,
+        max_gross: Optional[int] = None
+    ) -> list:
+        """Build the WHERE conditions shared by filtered finders and counts."""
+        conditions = []
+        if genre:
+            conditions.append(self._genre_condition(genre))
+        if year:
+            conditions.append(Movie.released_year == year)
+        if min_rating:
+            conditions.append(Movie.imdb_rating >= min_rating)
+        if max_rating is not None:
+            conditions.append(Movie.imdb_rating <= max_rating)
+        if director:
+            conditions.append(Movie.director.ilike(f"%{director}%"))
+        if actor:
+            conditions.append(self._actor_condition(actor))
+        if min_runtime is not None:
+            conditions.append(Movie.runtime_minutes >= min_runtime)
+        if max_runtime is not None:
+            conditions.append(Movie.runtime_minutes <= max_runtime)
+        if min_gross is not None:
+            conditions.append(Movie.gross_usd >= min_gross)
+        if max_gross is not None:
+            conditions.append(Movie.gross_usd <= max_gross)
+        return conditions
+
+    def _genre_condition(self, genre: str):
+        """Match movies tagged with a genre through the indexed association table."""
+        return Movie.id.in_(
+            select(MovieGenreLink.movie_id)
+            .join(Genre, Genre.id == MovieGenreLink.genre_id)
+            .where(Genre.name_key == normalize_key(genre))
+        )
+
+    def _actor_condition(self, actor: str):
+        """Match movies featuring an actor through the indexed association table."""
+        return Movie.id.in_(
+            select(MovieCastLink.movie_id)
+            .join(Person, Person.id == MovieCastLink.person_id)
+            .where(Person.name_key == normalize_key(actor))
+        )
+
+    def rebuild_genre_and_cast_links(self, batch_size: int = 500) -> int:
+        """Repopulate the genre and cast tables for every movie; returns rows processed."""
+        processed = 0
+        last_id = 0
+        while True:
+            movies = list(self.session.exec(
+                select(Movie).where(Movie.id > last_id).order_by(Movie.id).limit(batch_size)
+            ).all())
+            if not movies:
+                return processed
+            self._sync_links(movies)
+            self.session.commit()
+            processed += len(movies)
+            last_id = movies[-1].id
+
+    def _sync_links(self, movies: List[Movie], replace: bool = True) -> None:
+        """Write genre and cast association rows derived from the movies' text columns."""
+        if not movies:
+            return
+        if replace:
+            self._delete_links([movie.id for movie in movies])
+
+        parsed = [
+            (
+                movie.id,
+                [(normalize_key(name), name) for name in split_genres(movie.genre)],
+                [(billing, normalize_key(name), name) for billing, name in self._cast_of(movie)]
+            )
+            for movie in movies
+        ]
+        genre_ids = self._resolve_names(Genre, {key: name for _, genres, _ in parsed for key, name in genres})
+        person_ids = self._resolve_names(Person, {key: name for _, _, cast in parsed for _, key, name in cast})
+
+        genre_links = {
+            (movie_id, genre_ids[key])
+            for movie_id, genres, _ in parsed
+            for key, _ in genres
+        }
+        cast_links: Dict[Tuple[int, int], int] = {}
+        for movie_id, _, cast in parsed:
+            for billing, key, _ in cast:
+                cast_links.setdefault((movie_id, person_ids[key]), billing)
+
+        if genre_links:
+            self.session.execute(
+                insert(MovieGenreLink.__table__),
+                [{"movie_id": movie_id, "genre_id": genre_id} for movie_id, genre_id in genre_links]
+            )
+        if cast_links:
+            self.session.execute(
+                insert(MovieCastLink.__table__),
+                [
+                    {"movie_id": movie_id, "person_id": person_id, "billing": billing}
+                    for (movie_id, person_id), billing in cast_links.items()
+                ]
+            )
+
+    def _delete_links(self, movie_ids: List[int]) -> None:
+        """Remove association rows so the movies can be rewritten or deleted."""
+        for link in (MovieGenreLink, MovieCastLink):
+            table = link.__table__
+            self.session.execute(delete(table).where(table.c.movie_id.in_(movie_ids)))
+
+    def _resolve_names(self, model, wanted: Dict[str, str]) -> Dict[str, int]:
+        """Map normalized names to ids for Genre or Person, inserting unseen ones.
+
+        A concurrent writer may insert the same new name first; ON CONFLICT DO
+        NOTHING skips it and the re-select below picks up that writer's id.
+        """
+        if not wanted:
+            return {}
+
+        ids = self._ids_by_name_key(model, list(wanted))
+        missing = [key for key in wanted if key not in ids]
+        if missing:
+            self.session.execute(
+                self._dialect_insert(model.__table__).on_conflict_do_nothing(index_elements=["name_key"]),
+                [{"name": wanted[key], "name_key": key} for key in missing]
+            )
+            ids.update(self._ids_by_name_key(model, missing))
+        return ids
+
+    def _ids_by_name_key(self, model, keys: List[str]) -> Dict[str, int]:
+        """Look up Genre or Person ids by normalized name, chunking long key lists."""
+        ids: Dict[str, int] = {}
+        for start in range(0, len(keys), IN_CLAUSE_CHUNK):
+            chunk = keys[start:start + IN_CLAUSE_CHUNK]
+            ids.update(self.session.exec(
+                select(model.name_key, model.id).where(model.name_key.in_(chunk))
+            ).all())
+        return ids
 
+    def _cast_of(self, movie: Movie) -> List[Tuple[int, str]]:
+        """Billed cast of a movie as (billing, name) pairs."""
+        names = [getattr(movie, field) for field in CAST_FIELDS]
+        return [(billing, name.strip()) for billing, name in enumerate(names, start=1) if name and name.strip()]
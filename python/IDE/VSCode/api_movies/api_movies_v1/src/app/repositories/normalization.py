@@ -0,0 +1,44 @@
+"""
+Normalization helpers for the lookup keys stored alongside movie data.
+"""
+import re
+from typing import List, Optional
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_key(value: str) -> str:
+    """Case-fold and collapse whitespace so equal names share one indexed key."""
+    return _WHITESPACE.sub(" ", value).strip().casefold()
+
+
+def split_genres(genre: Optional[str]) -> List[str]:
+    """Split a comma-separated genre string such as "Crime, Drama"."""
+    if not genre:
+        return []
+    return [name.strip() for name in genre.split(",") if name.strip()]
+
+
+_RUNTIME = re.compile(
+    r"\s*(?:(\d+)\s*h(?:ours?|rs?)?)?\s*(?:(\d+)\s*(?:m|mins?|minutes?)?)?\s*",
+    re.IGNORECASE,
+)
+
+
+def parse_runtime_minutes(runtime: Optional[str]) -> Optional[int]:
+    """Parse a runtime such as "142 min" or "2h 22m" into minutes."""
+    if not runtime:
+        return None
+    match = _RUNTIME.fullmatch(runtime)
+    if not match or not any(match.groups()):
+        return None
+    hours, minutes = match.groups()
+    return int(hours or 0) * 60 + int(minutes or 0)
+
+
+def parse_gross_usd(gross: Optional[str]) -> Optional[int]:
+    """Parse a gross such as "28,341,469" or "$28,341,469" into whole dollars."""
+    if not gross:
+        return None
+    digits = gross.strip().lstrip("$").replace(",", "").strip()
+    return int(digits) if digits.isdigit() else None
@@ -0,0 +1,148 @@
+"""
+Opaque cursors for keyset pagination of movie finders.
+
+A cursor records the sort key of the last row on a page, so the next page
+is fetched with a WHERE clause on that key instead of an OFFSET that makes
+the database scan and discard every earlier row.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlmodel import and_, or_
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or belongs to another sort."""
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """A stable sort order usable for keyset pagination.
+
+    `fields` must end with a unique column so that the order is total.
+    """
+    name: str
+    fields: Tuple[str, ...]
+    descending: bool = False
+
+
+BY_ID = Keyset("id", ("id",))
+BY_RATING = Keyset("rating", ("imdb_rating", "id"), descending=True)
+BY_RUNTIME = Keyset("runtime", ("runtime_minutes", "id"), descending=True)
+BY_GROSS = Keyset("gross", ("gross_usd", "id"), descending=True)
+
+# Sort options accepted by filtered listings, by name
+SORT_KEYSETS = {keyset.name: keyset for keyset in (BY_ID, BY_RATING, BY_RUNTIME, BY_GROSS)}
+
+# Relevance-ranked search has no stable seekable key, so its cursor is an offset
+RELEVANCE = "relevance"
+
+# JSON types a cursor may carry for each keyset field; sorted listings skip NULL keys
+CURSOR_VALUE_TYPES = {
+    "id": (int,),
+    "imdb_rating": (int, float),
+    "runtime_minutes": (int,),
+    "gross_usd": (int,),
+}
+
+# Integers outside a BIGINT would fail in the database instead of as a bad cursor
+_BIGINT_RANGE = range(-2 ** 63, 2 ** 63)
+
+
+def _encode(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+    if not isinstance(payload, dict):
+        raise InvalidCursorError("Invalid pagination cursor")
+    return payload
+
+
+def encode_cursor(keyset: Keyset, values: Sequence[Any]) -> str:
+    """Encode the sort key of a row into an opaque URL-safe cursor."""
+    return _encode({"k": keyset.name, "v": list(values)})
+
+
+def decode_cursor(cursor: str, keyset: Keyset) -> List[Any]:
+    """Decode a cursor produced by `encode_cursor` for the same keyset."""
+    payload = _decode(cursor)
+    values = payload.get("v")
+    if payload.get("k") != keyset.name or not isinstance(values, list) or len(values) != len(keyset.fields):
+        raise InvalidCursorError("Pagination cursor does not match this listing")
+    for field, value in zip(keyset.fields, values):
+        if not _valid_cursor_value(value, CURSOR_VALUE_TYPES[field]):
+            raise InvalidCursorError("Invalid pagination cursor")
+    return values
+
+
+def _valid_cursor_value(value: Any, types: Tuple[type, ...]) -> bool:
+    # bool is an int subclass, but true/false is never a sort key
+    if isinstance(value, bool) or not isinstance(value, types):
+        return False
+    return not isinstance(value, int) or value in _BIGINT_RANGE
+
+
+def encode_offset_cursor(name: str, offset: int) -> str:
+    """Encode a position for orderings that have no seekable key, such as relevance."""
+    return _encode({"k": name, "o": offset})
+
+
+def decode_offset_cursor(cursor: str, name: str) -> int:
+    """Decode a cursor produced by `encode_offset_cursor` for the same ordering."""
+    payload = _decode(cursor)
+    offset = payload.get("o")
+    if payload.get("k") != name or not isinstance(offset, int) or offset < 0:
+        raise InvalidCursorError("Pagination cursor does not match this listing")
+    return offset
+
+
+def next_cursor(rows: Sequence[Any], limit: int, keyset: Keyset) -> Optional[str]:
+    """Return the cursor for the page after `rows`, or None on the last page."""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(keyset, [getattr(last, field) for field in keyset.fields])
+
+
+def next_offset_cursor(
+    rows: Sequence[Any],
+    offset: int,
+    limit: int,
+    name: str,
+    cursor: Optional[str] = None
+) -> Optional[str]:
+    """Return the offset cursor for the page after `rows`, or None on the last page."""
+    if len(rows) < limit:
+        return None
+    if cursor:
+        offset = decode_offset_cursor(cursor, name)
+    return encode_offset_cursor(name, offset + len(rows))
+
+
+def keyset_order(columns: Sequence[Any], keyset: Keyset) -> list:
+    """ORDER BY clauses for the keyset."""
+    return [column.desc() if keyset.descending else column.asc() for column in columns]
+
+
+def keyset_predicate(columns: Sequence[Any], values: Sequence[Any], keyset: Keyset):
+    """WHERE clause selecting rows strictly after `values` in keyset order.
+
+    Expanded into OR/AND form rather than a row-value comparison so that it
+    works on every backend and still lets the planner use the index.
+    """
+    branches = []
+    for i, column in enumerate(columns):
+        equal = [columns[j] == values[j] for j in range(i)]
+        after = column < values[i] if keyset.descending else column > values[i]
+        branches.append(and_(*equal, after))
+    return or_(*branches)
@@ -0,0 +1,81 @@
+"""
+Sparse fieldsets for movie listings.
+
+A `fields=` projection selects only the requested columns, so list views
+skip the long `overview` text and ORM hydration; finders then return
+lightweight rows instead of `Movie` entities. `raw_page` turns those rows
+straight into plain data for responses that skip model validation.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..models.movie import Movie, MoviePage, MovieRead, MovieSparsePage
+from .pagination import Keyset
+
+# Fields a client may request, in response order
+PROJECTABLE_FIELDS = ("id",) + tuple(name for name in MovieRead.model_fields if name != "id")
+
+
+def parse_fields(fields: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    """Validate a requested fieldset; None selects the whole movie and `id` is always included."""
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields if name.strip()}
+    if not requested:
+        raise ValueError("Fields must name at least one field")
+    unknown = requested.difference(PROJECTABLE_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. Allowed: {', '.join(PROJECTABLE_FIELDS)}"
+        )
+    requested.add("id")
+    return tuple(name for name in PROJECTABLE_FIELDS if name in requested)
+
+
+def projection_columns(fields: Sequence[str], keyset: Keyset) -> list:
+    """Columns selected for `fields`, plus the keyset's sort key so the next cursor can be built."""
+    names = list(fields) + [name for name in keyset.fields if name not in fields]
+    return [getattr(Movie, name) for name in names]
+
+
+def sparse_item(row: Any, fields: Sequence[str]) -> Dict[str, Any]:
+    """The requested fields of a projected row, dropping columns selected only for paging."""
+    return {name: getattr(row, name) for name in fields}
+
+
+def split_total(result: Union[List[Any], Tuple[List[Any], int]]) -> Tuple[List[Any], Optional[int]]:
+    """(rows, total) of a finder result; total is None unless it was called with_total."""
+    if isinstance(result, tuple):
+        return result
+    return result, None
+
+
+def movie_page(
+    movies: List[Any],
+    cursor: Optional[str],
+    fields: Optional[Sequence[str]] = None,
+    total: Optional[int] = None
+) -> Union[MoviePage, MovieSparsePage]:
+    """Page of full movies, or of only the requested fields when the finder was projected."""
+    fields = parse_fields(fields)
+    if fields:
+        return MovieSparsePage(
+            items=[sparse_item(row, fields) for row in movies], next_cursor=cursor, total=total
+        )
+    return MoviePage(
+        items=[MovieRead.model_validate(movie) for movie in movies], next_cursor=cursor, total=total
+    )
+
+
+def raw_page(
+    rows: List[Any],
+    cursor: Optional[str],
+    fields: Optional[Sequence[str]] = None,
+    total: Optional[int] = None
+) -> Dict[str, Any]:
+    """Page envelope as plain data built from projected rows, without model validation.
+
+    The rows must come from a finder projected on `fields` (every field when
+    None); their leading columns are the fields in PROJECTABLE_FIELDS order.
+    """
+    fields = parse_fields(fields) or PROJECTABLE_FIELDS
+    return {"items": [dict(zip(fields, row)) for row in rows], "next_cursor": cursor, "total": total}
@@ -0,0 +1,122 @@
+"""
+Full-text search index for the movie table.
+
+On Postgres the index is a generated `search_vector` tsvector column with a
+GIN index; on SQLite it is an external-content FTS5 table kept in sync by
+triggers. Either way the database maintains the index itself, so single
+creates, updates, bulk inserts and deletes all keep it current.
+"""
+import re
+from typing import Optional, Tuple
+
+from sqlalchemy import column, event, false, literal_column, table
+from sqlalchemy.engine import Connection
+from sqlmodel import Session, func, select, or_
+
+from ..models.movie import Movie
+
+TEXT_SEARCH_CONFIG = "english"
+
+_movie_fts = table("movie_fts", column("rowid"))
+
+_POSTGRES_DDL = (
+    f"""
+    ALTER TABLE movie ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(series_title, '')), 'A') ||
+        setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(overview, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_movie_search_vector ON movie USING GIN (search_vector)",
+)
+
+_SQLITE_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS movie_fts USING fts5(
+        series_title, overview,
+        content='movie', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movie_fts_ai AFTER INSERT ON movie BEGIN
+        INSERT INTO movie_fts(rowid, series_title, overview)
+        VALUES (new.id, new.series_title, new.overview);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movie_fts_ad AFTER DELETE ON movie BEGIN
+        INSERT INTO movie_fts(movie_fts, rowid, series_title, overview)
+        VALUES ('delete', old.id, old.series_title, old.overview);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movie_fts_au AFTER UPDATE OF series_title, overview ON movie BEGIN
+        INSERT INTO movie_fts(movie_fts, rowid, series_title, overview)
+        VALUES ('delete', old.id, old.series_title, old.overview);
+        INSERT INTO movie_fts(rowid, series_title, overview)
+        VALUES (new.id, new.series_title, new.overview);
+    END
+    """,
+)
+
+
+def install_search_index(connection: Connection) -> None:
+    """Create the full-text index objects for the connection's dialect."""
+    if connection.dialect.name == "postgresql":
+        statements = _POSTGRES_DDL
+    elif connection.dialect.name == "sqlite":
+        statements = _SQLITE_DDL
+    else:
+        return
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+
+def rebuild_search_index(session: Session) -> None:
+    """Re-index existing rows after the index was added to a populated table."""
+    if session.get_bind().dialect.name == "sqlite":
+        session.connection().exec_driver_sql("INSERT INTO movie_fts(movie_fts) VALUES ('rebuild')")
+        session.commit()
+
+
+@event.listens_for(Movie.__table__, "after_create")
+def _install_after_create(target, connection, **kw) -> None:
+    install_search_index(connection)
+
+
+def _fts5_query(query: str) -> Optional[str]:
+    """Turn free text into a safe FTS5 expression, prefix-matching the last word."""
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def ranked_search(dialect_name: str, query: str) -> Tuple[object, list]:
+    """Return a SELECT of matching movies and its relevance ORDER BY clauses.
+
+    Backends without a full-text index fall back to a substring match in id order.
+    """
+    if dialect_name == "postgresql":
+        tsquery = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+        vector = literal_column("movie.search_vector")
+        statement = select(Movie).where(vector.op("@@")(tsquery))
+        return statement, [func.ts_rank_cd(vector, tsquery).desc(), Movie.id]
+
+    if dialect_name == "sqlite":
+        fts_query = _fts5_query(query)
+        fts = literal_column("movie_fts")
+        statement = select(Movie).join(_movie_fts, _movie_fts.c.rowid == Movie.id)
+        statement = statement.where(fts.op("MATCH")(fts_query) if fts_query else false())
+        # bm25 is lower-is-better; weight title matches above overview matches
+        return statement, [func.bm25(fts, 10.0, 1.0), Movie.id]
+
+    statement = select(Movie).where(
+        or_(
+            Movie.series_title.ilike(f"%{query}%"),
+            Movie.overview.ilike(f"%{query}%")
+        )
+    )
+    return statement, [Movie.id]
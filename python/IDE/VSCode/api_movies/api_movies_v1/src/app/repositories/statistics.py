@@ -0,0 +1,163 @@
+"""
+Catalog statistics computed in a single SQL round-trip.
+
+Every section is a branch of one UNION ALL with a common row shape
+(section, label, n, value, movie_id, title, year); `fold_statistics`
+turns the rows back into the nested dict served by the API. Window
+functions give percentiles and top-N per genre without extra queries.
+"""
+from typing import Any, Dict, Iterable, Sequence
+
+from sqlalchemy import Float, Integer, String, case, cast, literal, null, union_all
+from sqlmodel import func, select
+
+from ..models.movie import Genre, Movie, MovieGenreLink
+
+PERCENTILES = (0.5, 0.9, 0.99)
+UNKNOWN_LABEL = "unknown"
+
+
+def _row(section: str, label=None, n=None, value=None, movie_id=None, title=None, year=None) -> list:
+    """Columns of one UNION ALL branch, typed so every backend agrees on the shape."""
+    return [
+        literal(section, String).label("section"),
+        cast(label if label is not None else null(), String).label("label"),
+        cast(n if n is not None else null(), Integer).label("n"),
+        cast(value if value is not None else null(), Float).label("value"),
+        cast(movie_id if movie_id is not None else null(), Integer).label("movie_id"),
+        cast(title if title is not None else null(), String).label("title"),
+        cast(year if year is not None else null(), Integer).label("year"),
+    ]
+
+
+def _percentile_branches(section: str, column) -> list:
+    """Nearest-rank percentiles: the smallest value whose cumulative distribution reaches p."""
+    ranked = (
+        select(column.label("v"), func.cume_dist().over(order_by=column).label("cd"))
+        .where(column.is_not(None))
+        .cte(f"{section}_ranks")
+    )
+    return [
+        select(*_row(
+            section,
+            label=literal(f"p{round(p * 100):d}"),
+            value=func.min(case((ranked.c.cd >= p, ranked.c.v)))
+        )).select_from(ranked)
+        for p in PERCENTILES
+    ]
+
+
+def _ranked_movies(order_by: Sequence[Any], where, partition_by=None, *extra_columns):
+    """Movies numbered 1.. in `order_by` order, restarting per partition."""
+    return (
+        select(
+            Movie.id, Movie.series_title, Movie.imdb_rating, Movie.released_year, *extra_columns,
+            func.row_number().over(partition_by=partition_by, order_by=order_by).label("rn")
+        )
+        .where(where)
+    )
+
+
+def statistics_statement(top_n: int, recent_since_year: int):
+    """Build the UNION ALL statement covering every statistics section."""
+    rated = Movie.imdb_rating.is_not(None)
+    decade = Movie.released_year // 10 * 10
+
+    top_rated = _ranked_movies([Movie.imdb_rating.desc(), Movie.id], rated).subquery()
+    recent = _ranked_movies(
+        [Movie.released_year.desc(), Movie.id], Movie.released_year >= recent_since_year
+    ).subquery()
+    top_by_genre = (
+        _ranked_movies(
+            [Movie.imdb_rating.desc(), Movie.id], rated, MovieGenreLink.genre_id, Genre.name
+        )
+        .join(MovieGenreLink, MovieGenreLink.movie_id == Movie.id)
+        .join(Genre, Genre.id == MovieGenreLink.genre_id)
+        .subquery()
+    )
+
+    branches = [
+        select(*_row("total", n=func.count(), value=func.avg(Movie.imdb_rating))),
+        select(*_row("genre", label=Genre.name, n=func.count()))
+        .select_from(MovieGenreLink)
+        .join(Genre, Genre.id == MovieGenreLink.genre_id)
+        .group_by(Genre.id, Genre.name),
+        select(*_row("decade", label=decade, n=func.count()))
+        .group_by(decade),
+        select(*_row("certificate", label=Movie.certificate, n=func.count()))
+        .group_by(Movie.certificate),
+        *_percentile_branches("rating_percentile", Movie.imdb_rating),
+        *_percentile_branches("vote_percentile", Movie.no_of_votes),
+    ]
+    for section, ranked in (("top_rated", top_rated), ("recent", recent)):
+        branches.append(
+            select(*_row(
+                section, n=ranked.c.rn, value=ranked.c.imdb_rating, movie_id=ranked.c.id,
+                title=ranked.c.series_title, year=ranked.c.released_year
+            )).where(ranked.c.rn <= top_n)
+        )
+    branches.append(
+        select(*_row(
+            "top_by_genre", label=top_by_genre.c.name, n=top_by_genre.c.rn,
+            value=top_by_genre.c.imdb_rating, movie_id=top_by_genre.c.id,
+            title=top_by_genre.c.series_title, year=top_by_genre.c.released_year
+        )).where(top_by_genre.c.rn <= top_n)
+    )
+    return union_all(*branches)
+
+
+def fold_statistics(rows: Iterable[Any]) -> Dict[str, Any]:
+    """Turn statistics rows into the nested response dict."""
+    stats: Dict[str, Any] = {
+        "total_movies": 0,
+        "average_rating": None,
+        "rating_percentiles": {},
+        "vote_percentiles": {},
+        "movies_by_genre": {},
+        "movies_by_decade": {},
+        "movies_by_certificate": {},
+        "top_rated_movies": [],
+        "recent_movies": [],
+        "top_rated_by_genre": {},
+    }
+    ranked: Dict[str, list] = {"top_rated": [], "recent": []}
+    by_genre: Dict[str, list] = {}
+    for row in rows:
+        section, label = row.section, row.label if row.label is not None else UNKNOWN_LABEL
+        if section == "total":
+            stats["total_movies"] = row.n
+            stats["average_rating"] = round(row.value, 2) if row.value is not None else None
+        elif section == "genre":
+            stats["movies_by_genre"][label] = row.n
+        elif section == "decade":
+            stats["movies_by_decade"][label] = row.n
+        elif section == "certificate":
+            stats["movies_by_certificate"][label] = row.n
+        elif section == "rating_percentile":
+            stats["rating_percentiles"][label] = row.value
+        elif section == "vote_percentile":
+            stats["vote_percentiles"][label] = int(row.value) if row.value is not None else None
+        elif section in ranked:
+            ranked[section].append(row)
+        elif section == "top_by_genre":
+            by_genre.setdefault(label, []).append(row)
+
+    stats["top_rated_movies"] = [
+        {"id": row.movie_id, "title": row.title, "rating": row.value, "year": row.year}
+        for row in sorted(ranked["top_rated"], key=lambda row: row.n)
+    ]
+    stats["recent_movies"] = [
+        {"id": row.movie_id, "title": row.title, "year": row.year}
+        for row in sorted(ranked["recent"], key=lambda row: row.n)
+    ]
+    stats["top_rated_by_genre"] = {
+        genre: [
+            {"id": row.movie_id, "title": row.title, "rating": row.value, "year": row.year}
+            for row in sorted(genre_rows, key=lambda row: row.n)
+        ]
+        for genre, genre_rows in sorted(by_genre.items())
+    }
+    for key in ("movies_by_genre", "movies_by_certificate"):
+        stats[key] = dict(sorted(stats[key].items(), key=lambda item: (-item[1], item[0])))
+    stats["movies_by_decade"] = dict(sorted(stats["movies_by_decade"].items()))
+    return stats
@@ -0,0 +1,163 @@
+from typing import Any, Optional, Sequence, Union
+from sqlmodel.ext.asyncio.session import AsyncSession
+from ..core.cache import AsyncSingleFlight, QueryCache, call_key
+from ..models.movie import MoviePage, MovieSparsePage
+from ..repositories.movie_repository import FinderResult
+from ..repositories.pagination import BY_ID, RELEVANCE, Keyset, next_cursor, next_offset_cursor
+from ..repositories.projection import movie_page, split_total
+from .movie_service import MovieService, detach_movies
+
+class AsyncMovieService:
+    """Async counterpart of MovieService's request-serving methods.
+
+    Calls run the synchronous service inside `AsyncSession.run_sync`, so
+    validation, caching and invalidation behave exactly as in MovieService
+    while database I/O goes through the async driver. This replaces an
+    async repository on purpose: run_sync awaits every statement, so only
+    the ORM's CPU work runs on the event loop, as it would natively. Share
+    the caches with the sync stack so writes on either side invalidate both.
+    
+    With an AsyncSingleFlight, concurrent identical calls to the cached
+    reads share one execution on the event loop.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        query_cache: Optional[QueryCache] = None,
+        single_flight: Optional[AsyncSingleFlight] = None
+    ) -> None:
+        self.session = session
+        self.query_cache = query_cache
+        self.single_flight = single_flight
+
+    async def _run(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        def call(sync_session):
+            service = MovieService(sync_session, query_cache=self.query_cache)
+            return getattr(service, method)(*args, **kwargs)
+        return await self.session.run_sync(call)
+
+    async def _coalesced(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a read, sharing the execution with identical calls already in flight."""
+        if self.single_flight is None:
+            return await self._run(method, *args, **kwargs)
+        
+        async def load():
+            # Followers get the result outside the leader's session
+            return detach_movies(await self._run(method, *args, **kwargs))
+        
+        if self.query_cache is not None:
+            key = self.query_cache.make_key(method, *args, **kwargs)
+        else:
+            key = call_key(method, *args, **kwargs)
+        return await self.single_flight.do(key, load, f"AsyncMovieService.{method}")
+
+    async def create_movie(self, *args, **kwargs):
+        return await self._run("create_movie", *args, **kwargs)
+
+    async def get_movie_by_id(self, *args, **kwargs):
+        return await self._coalesced("get_movie_by_id", *args, **kwargs)
+
+    async def get_movies_by_ids(self, *args, **kwargs):
+        return await self._run("get_movies_by_ids", *args, **kwargs)
+
+    async def get_movie_version(self, *args, **kwargs):
+        return await self._run("get_movie_version", *args, **kwargs)
+
+    async def get_catalog_generation(self, *args, **kwargs):
+        return await self._run("get_catalog_generation", *args, **kwargs)
+
+    async def get_all_movies(self, *args, **kwargs):
+        return await self._run("get_all_movies", *args, **kwargs)
+
+    async def update_movie(self, *args, **kwargs):
+        return await self._run("update_movie", *args, **kwargs)
+
+    async def delete_movie(self, *args, **kwargs):
+        return await self._run("delete_movie", *args, **kwargs)
+
+    async def search_movies(self, *args, **kwargs):
+        return await self._run("search_movies", *args, **kwargs)
+
+    async def get_movies_by_genre(self, *args, **kwargs):
+        return await self._run("get_movies_by_genre", *args, **kwargs)
+
+    async def get_movies_by_actor(self, *args, **kwargs):
+        return await self._run("get_movies_by_actor", *args, **kwargs)
+
+    async def get_movies_by_year(self, *args, **kwargs):
+        return await self._run("get_movies_by_year", *args, **kwargs)
+
+    async def get_movies_by_director(self, *args, **kwargs):
+        return await self._run("get_movies_by_director", *args, **kwargs)
+
+    async def get_movies_by_rating_range(self, *args, **kwargs):
+        return await self._run("get_movies_by_rating_range", *args, **kwargs)
+
+    async def get_top_rated_movies(self, *args, **kwargs):
+        return await self._coalesced("get_top_rated_movies", *args, **kwargs)
+
+    async def get_movies_count(self, *args, **kwargs):
+        return await self._coalesced("get_movies_count", *args, **kwargs)
+
+    async def count_movies(self, *args, **kwargs):
+        return await self._run("count_movies", *args, **kwargs)
+
+    async def get_movies_by_multiple_filters(self, *args, **kwargs):
+        return await self._run("get_movies_by_multiple_filters", *args, **kwargs)
+
+    async def faceted_search(self, *args, **kwargs):
+        return await self._run("faceted_search", *args, **kwargs)
+
+    async def get_recent_movies(self, *args, **kwargs):
+        return await self._coalesced("get_recent_movies", *args, **kwargs)
+
+    async def bulk_create_movies(self, *args, **kwargs):
+        return await self._run("bulk_create_movies", *args, **kwargs)
+
+    async def bulk_import_movies(self, *args, **kwargs):
+        return await self._run("bulk_import_movies", *args, **kwargs)
+
+    async def bulk_upsert_movies(self, *args, **kwargs):
+        return await self._run("bulk_upsert_movies", *args, **kwargs)
+
+    async def bulk_update_movies(self, *args, **kwargs):
+        return await self._run("bulk_update_movies", *args, **kwargs)
+
+    async def find_bulk_conflicts(self, *args, **kwargs):
+        return await self._run("find_bulk_conflicts", *args, **kwargs)
+
+    async def get_movie_statistics(self, *args, **kwargs):
+        return await self._coalesced("get_movie_statistics", *args, **kwargs)
+
+    def cache_stats(self) -> dict:
+        """Hit, miss and eviction counters for tuning the caches."""
+        stats = self.query_cache.stats() if self.query_cache is not None else {}
+        if self.single_flight is not None:
+            stats["single_flight"] = self.single_flight.stats()
+        return stats
+
+    def build_page(
+        self,
+        movies: FinderResult,
+        limit: int,
+        keyset: Keyset = BY_ID,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[MoviePage, MovieSparsePage]:
+        """Wrap a finder result, or its (rows, total), in a page envelope carrying the next cursor."""
+        movies, total = split_total(movies)
+        return movie_page(movies, next_cursor(movies, limit, keyset), fields, total)
+
+    def build_search_page(
+        self,
+        movies: FinderResult,
+        offset: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[MoviePage, MovieSparsePage]:
+        """Wrap search results, or their (rows, total), in a page envelope carrying the next cursor."""
+        movies, total = split_total(movies)
+        return movie_page(
+            movies, next_offset_cursor(movies, offset, limit, RELEVANCE, cursor), fields, total
+        )
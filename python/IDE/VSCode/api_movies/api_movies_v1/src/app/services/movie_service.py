@@ -1,102 +1,257 @@
-from typing import List, Optional
+import time
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from sqlmodel import Session
-from ..models.movie import Movie, MovieCreate, MovieUpdate
-from ..repositories.movie_repository import MovieRepository
+from ..core.cache import QueryCache, SingleFlight, call_key
+from ..db.export import EXPORT_FORMATS, csv_chunks, ndjson_chunks
+from ..db.ingest import IngestReport, read_movie_csv
+from ..models.movie import (
+    Movie,
+    MovieBatchResult,
+    MovieBulkResult,
+    MovieBulkWriteResult,
+    MovieConflict,
+    MovieCreate,
+    MovieFacetedPage,
+    MovieFacets,
+    MovieFacetValue,
+    MoviePage,
+    MoviePatch,
+    MovieRead,
+    MovieSparsePage,
+    MovieUpdate,
+    utcnow,
+)
+from ..repositories.movie_repository import DuplicateMovieError, FinderResult, MovieRepository
+from ..repositories.normalization import normalize_key
+from ..repositories.pagination import BY_ID, SORT_KEYSETS, Keyset, next_cursor
+from ..repositories.projection import movie_page, parse_fields, raw_page, split_total
+
+# Most ids resolved by one get_movies_by_ids call
+MAX_BATCH_IDS = 1000
+
+# Top-N size of the materialized statistics snapshot
+STATISTICS_TOP_N = 5
+
+def detach_movies(result: Any) -> Any:
+    """MovieRead copies of ORM results, safe to share beyond their session; other values pass through."""
+    if isinstance(result, list):
+        return [MovieRead.model_validate(movie) if isinstance(movie, Movie) else movie for movie in result]
+    if isinstance(result, Movie):
+        return MovieRead.model_validate(result)
+    return result
 
 class MovieService:
     """Service layer for movie business logic and validation."""
     
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self,
+        session: Session,
+        query_cache: Optional[QueryCache] = None,
+        use_statistics_snapshot: bool = True,
+        single_flight: Optional[SingleFlight] = None
+    ) -> None:
         self.repository = MovieRepository(session)
+        self.query_cache = query_cache
+        self.use_statistics_snapshot = use_statistics_snapshot
+        self.single_flight = single_flight
 
     def create_movie(self, movie_data: MovieCreate) -> Movie:
         """Create a new movie with business logic validation."""
         # Business logic validation
         self._validate_movie_data(movie_data)
+        self.repository.use_primary()
         
-        # Check if movie already exists
-        if self.repository.movie_exists_by_title_and_year(
-            movie_data.series_title, movie_data.released_year
+        # Dated movies are kept unique by the (title_key, released_year) index;
+        # NULL years never conflict there, so undated movies are checked here.
+        if movie_data.released_year is None and self.repository.movie_exists_by_title_and_year(
+            movie_data.series_title
         ):
+            raise ValueError(f"Movie '{movie_data.series_title}' already exists")
+        
+        try:
+            movie = self.repository.create_movie(movie_data)
+        except DuplicateMovieError as e:
             raise ValueError(
                 f"Movie '{movie_data.series_title}' ({movie_data.released_year}) already exists"
-            )
+            ) from e
+        self._invalidate_caches()
+        return movie
+
+    def get_movie_by_id(self, movie_id: int, version: Optional[int] = None) -> Optional[Movie]:
+        """Get movie by ID with validation.
+
+        Pass the row's current `version` (from get_movie_version) to key the
+        cached copy on it, so a copy cached before the row changed is never served.
+        """
+        if movie_id <= 0:
+            raise ValueError("Movie ID must be a positive integer")
         
-        return self.repository.create_movie(movie_data)
+        return self._cached(
+            "get_movie_by_id",
+            lambda: self._snapshot(self.repository.get_movie_by_id(movie_id)),
+            movie_id,
+            version
+        )
 
-    def get_movie_by_id(self, movie_id: int) -> Optional[Movie]:
-        """Get movie by ID with validation."""
+    def get_movies_by_ids(self, movie_ids: List[int]) -> MovieBatchResult:
+        """Get many movies in the caller's order, reporting ids that don't exist."""
+        if not movie_ids:
+            raise ValueError("Movie id list cannot be empty")
+        
+        if len(movie_ids) > MAX_BATCH_IDS:
+            raise ValueError(f"Cannot fetch more than {MAX_BATCH_IDS} movies at once")
+        
+        if any(movie_id <= 0 for movie_id in movie_ids):
+            raise ValueError("Movie IDs must be positive integers")
+        
+        movie_ids = list(dict.fromkeys(movie_ids))
+        movies = self.repository.get_movies_by_ids(movie_ids)
+        return MovieBatchResult(
+            items=[MovieRead.model_validate(movies[movie_id]) for movie_id in movie_ids if movie_id in movies],
+            missing_ids=[movie_id for movie_id in movie_ids if movie_id not in movies]
+        )
+
+    def get_movie_version(self, movie_id: int) -> Optional[Tuple[int, datetime]]:
+        """Get a movie's (version, updated_at) without loading the row; never cached."""
         if movie_id <= 0:
             raise ValueError("Movie ID must be a positive integer")
         
-        return self.repository.get_movie_by_id(movie_id)
+        return self.repository.get_movie_version(movie_id)
+
+    def get_catalog_generation(self) -> int:
+        """Get the catalog-wide write counter; never cached, so every worker agrees."""
+        return self.repository.get_catalog_generation()
 
-    def get_all_movies(self, offset: int = 0, limit: int = 10) -> List[Movie]:
+    def get_all_movies(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
         """Get paginated list of movies with validation."""
-        self._validate_pagination(offset, limit)
-        return self.repository.get_all_movies(offset=offset, limit=limit)
+        self._validate_pagination(offset, limit, cursor)
+        return self.repository.get_all_movies(
+            offset=offset, limit=limit, cursor=cursor, fields=parse_fields(fields), with_total=with_total
+        )
 
     def update_movie(self, movie_id: int, movie_update: MovieUpdate) -> Optional[Movie]:
         """Update movie with business logic validation."""
         if movie_id <= 0:
             raise ValueError("Movie ID must be a positive integer")
         
-        # Check if movie exists
-        existing_movie = self.repository.get_movie_by_id(movie_id)
-        if not existing_movie:
-            return None
-        
         # Validate update data
         self._validate_movie_update_data(movie_update)
         
-        return self.repository.update_movie(movie_id, movie_update)
+        # The repository returns None when no row matched the id
+        movie = self.repository.update_movie(movie_id, movie_update)
+        if movie is not None:
+            self._invalidate_caches()
+        return movie
 
     def delete_movie(self, movie_id: int) -> bool:
         """Delete movie with validation."""
         if movie_id <= 0:
             raise ValueError("Movie ID must be a positive integer")
         
-        return self.repository.delete_movie(movie_id)
+        deleted = self.repository.delete_movie(movie_id)
+        if deleted:
+            self._invalidate_caches()
+        return deleted
 
-    def search_movies(self, query: str, offset: int = 0, limit: int = 10) -> List[Movie]:
-        """Search movies with validation."""
+    def search_movies(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
+        """Full-text search with validation, ordered by relevance."""
         if not query or len(query.strip()) < 2:
             raise ValueError("Search query must be at least 2 characters long")
         
-        self._validate_pagination(offset, limit)
-        return self.repository.search_movies(query.strip(), offset, limit)
+        self._validate_pagination(offset, limit, cursor)
+        return self.repository.search_movies(query.strip(), offset, limit, cursor, parse_fields(fields), with_total)
 
-    def get_movies_by_genre(self, genre: str, offset: int = 0, limit: int = 10) -> List[Movie]:
+    def get_movies_by_genre(
+        self,
+        genre: str,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
         """Get movies by genre with validation."""
         if not genre or len(genre.strip()) < 2:
             raise ValueError("Genre must be at least 2 characters long")
         
-        self._validate_pagination(offset, limit)
-        return self.repository.get_movies_by_genre(genre.strip(), offset, limit)
+        self._validate_pagination(offset, limit, cursor)
+        return self.repository.get_movies_by_genre(genre.strip(), offset, limit, cursor, parse_fields(fields), with_total)
 
-    def get_movies_by_year(self, year: int, offset: int = 0, limit: int = 10) -> List[Movie]:
+    def get_movies_by_actor(
+        self,
+        actor: str,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
+        """Get an actor's filmography with validation."""
+        if not actor or len(actor.strip()) < 2:
+            raise ValueError("Actor name must be at least 2 characters long")
+        
+        self._validate_pagination(offset, limit, cursor)
+        return self.repository.get_movies_by_actor(actor.strip(), offset, limit, cursor, parse_fields(fields), with_total)
+
+    def get_movies_by_year(
+        self,
+        year: int,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
         """Get movies by year with validation."""
         if year < 1888 or year > 2030:  # Cinema history bounds
             raise ValueError("Year must be between 1888 and 2030")
         
-        self._validate_pagination(offset, limit)
-        return self.repository.get_movies_by_year(year, offset, limit)
+        self._validate_pagination(offset, limit, cursor)
+        return self.repository.get_movies_by_year(year, offset, limit, cursor, parse_fields(fields), with_total)
 
-    def get_movies_by_director(self, director: str, offset: int = 0, limit: int = 10) -> List[Movie]:
+    def get_movies_by_director(
+        self,
+        director: str,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
         """Get movies by director with validation."""
         if not director or len(director.strip()) < 2:
             raise ValueError("Director name must be at least 2 characters long")
         
-        self._validate_pagination(offset, limit)
-        return self.repository.get_movies_by_director(director.strip(), offset, limit)
+        self._validate_pagination(offset, limit, cursor)
+        return self.repository.get_movies_by_director(director.strip(), offset, limit, cursor, parse_fields(fields), with_total)
 
     def get_movies_by_rating_range(
         self, 
         min_rating: float, 
         max_rating: float, 
         offset: int = 0, 
-        limit: int = 10
-    ) -> List[Movie]:
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
         """Get movies by rating range with validation."""
         if min_rating < 0 or max_rating > 10:
             raise ValueError("Ratings must be between 0 and 10")
@@ -104,63 +259,183 @@ class MovieService:
         if min_rating > max_rating:
             raise ValueError("Minimum rating cannot be greater than maximum rating")
         
-        self._validate_pagination(offset, limit)
-        return self.repository.get_movies_by_rating_range(min_rating, max_rating, offset, limit)
+        self._validate_pagination(offset, limit, cursor)
+        return self.repository.get_movies_by_rating_range(
+            min_rating, max_rating, offset, limit, cursor, parse_fields(fields), with_total
+        )
 
-    def get_top_rated_movies(self, limit: int = 10) -> List[Movie]:
-        """Get top rated movies with validation."""
+    def get_top_rated_movies(self, limit: int = 10, generation: Optional[int] = None) -> List[Movie]:
+        """Get top rated movies with validation, cached per catalog generation."""
         if limit <= 0 or limit > 100:
             raise ValueError("Limit must be between 1 and 100")
         
-        return self.repository.get_top_rated_movies(limit)
+        return self._cached(
+            "get_top_rated_movies",
+            lambda: self._snapshot(self.repository.get_top_rated_movies(limit)),
+            limit,
+            self._catalog_generation(generation)
+        )
 
-    def get_movies_count(self) -> int:
-        """Get total count of movies."""
-        return self.repository.get_movies_count()
+    def get_movies_count(self, generation: Optional[int] = None) -> int:
+        """Get total count of movies, cached per catalog generation so any write invalidates it."""
+        return self._cached(
+            "get_movies_count",
+            self.repository.get_movies_count,
+            self._catalog_generation(generation)
+        )
 
-    def get_movies_by_multiple_filters(
+    def count_movies(
         self,
         genre: Optional[str] = None,
         year: Optional[int] = None,
-        min_rating: Optional[float] = None,
         director: Optional[str] = None,
-        offset: int = 0,
-        limit: int = 10
-    ) -> List[Movie]:
-        """Get movies with multiple filters and validation."""
-        # Validate individual filters
+        min_rating: Optional[float] = None,
+        max_rating: Optional[float] = None,
+        actor: Optional[str] = None
+    ) -> int:
+        """Count movies matching the given filters with validation."""
         if genre and len(genre.strip()) < 2:
             raise ValueError("Genre must be at least 2 characters long")
         
         if year and (year < 1888 or year > 2030):
             raise ValueError("Year must be between 1888 and 2030")
         
-        if min_rating and (min_rating < 0 or min_rating > 10):
-            raise ValueError("Rating must be between 0 and 10")
-        
         if director and len(director.strip()) < 2:
             raise ValueError("Director name must be at least 2 characters long")
         
-        self._validate_pagination(offset, limit)
+        if actor and len(actor.strip()) < 2:
+            raise ValueError("Actor name must be at least 2 characters long")
+        
+        for rating in (min_rating, max_rating):
+            if rating is not None and (rating < 0 or rating > 10):
+                raise ValueError("Ratings must be between 0 and 10")
+        
+        if min_rating is not None and max_rating is not None and min_rating > max_rating:
+            raise ValueError("Minimum rating cannot be greater than maximum rating")
+        
+        return self.repository.count_movies(
+            genre=genre.strip() if genre else None,
+            year=year,
+            director=director.strip() if director else None,
+            min_rating=min_rating,
+            max_rating=max_rating,
+            actor=actor.strip() if actor else None
+        )
+
+    def get_movies_by_multiple_filters(
+        self,
+        genre: Optional[str] = None,
+        year: Optional[int] = None,
+        min_rating: Optional[float] = None,
+        director: Optional[str] = None,
+        actor: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        min_runtime: Optional[int] = None,
+        max_runtime: Optional[int] = None,
+        min_gross: Optional[int] = None,
+        max_gross: Optional[int] = None,
+        sort: str = BY_ID.name,
+        fields: Optional[Sequence[str]] = None,
+        with_total: bool = False
+    ) -> FinderResult:
+        """Get movies with multiple filters and validation."""
+        self._validate_filters(genre, year, min_rating, director, actor)
+        self._validate_range("Runtime", min_runtime, max_runtime)
+        self._validate_range("Gross", min_gross, max_gross)
+        self._validate_pagination(offset, limit, cursor)
+        
+        if sort not in SORT_KEYSETS:
+            raise ValueError(f"Sort must be one of: {', '.join(SORT_KEYSETS)}")
         
         return self.repository.get_movies_by_multiple_filters(
             genre=genre.strip() if genre else None,
             year=year,
             min_rating=min_rating,
             director=director.strip() if director else None,
+            actor=actor.strip() if actor else None,
             offset=offset,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            min_runtime=min_runtime,
+            max_runtime=max_runtime,
+            min_gross=min_gross,
+            max_gross=max_gross,
+            sort=sort,
+            fields=parse_fields(fields),
+            with_total=with_total
         )
 
-    def get_recent_movies(self, years_back: int = 5, limit: int = 10) -> List[Movie]:
-        """Get recent movies with validation."""
+    def faceted_search(
+        self,
+        genre: Optional[str] = None,
+        year: Optional[int] = None,
+        min_rating: Optional[float] = None,
+        director: Optional[str] = None,
+        actor: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        generation: Optional[int] = None
+    ) -> MovieFacetedPage:
+        """Get a filtered page together with the total and facet counts for the filters.
+
+        Pass the catalog `generation` an ETag was built from to key the cached
+        page on it, so the body always matches the ETag.
+        """
+        self._validate_filters(genre, year, min_rating, director, actor)
+        self._validate_pagination(offset, limit, cursor)
+        
+        filters = {
+            "genre": genre.strip() if genre else None,
+            "year": year,
+            "min_rating": min_rating,
+            "director": director.strip() if director else None,
+            "actor": actor.strip() if actor else None,
+        }
+        
+        def load() -> MovieFacetedPage:
+            movies = self.repository.get_movies_by_multiple_filters(
+                **filters, offset=offset, limit=limit, cursor=cursor
+            )
+            total, facets = self.repository.get_facet_counts(**filters)
+            page = self.build_page(movies, limit)
+            return MovieFacetedPage(
+                items=page.items,
+                next_cursor=page.next_cursor,
+                total=total,
+                facets=MovieFacets(**{
+                    facet: [MovieFacetValue(value=value, count=count) for value, count in counts]
+                    for facet, counts in facets.items()
+                })
+            )
+        
+        return self._cached(
+            "faceted_search", load, *filters.values(), offset, limit, cursor,
+            self._catalog_generation(generation)
+        )
+
+    def get_recent_movies(
+        self,
+        years_back: int = 5,
+        limit: int = 10,
+        generation: Optional[int] = None
+    ) -> List[Movie]:
+        """Get recent movies with validation, cached per catalog generation."""
         if years_back <= 0 or years_back > 50:
             raise ValueError("Years back must be between 1 and 50")
         
         if limit <= 0 or limit > 100:
             raise ValueError("Limit must be between 1 and 100")
         
-        return self.repository.get_recent_movies(years_back, limit)
+        return self._cached(
+            "get_recent_movies",
+            lambda: self._snapshot(self.repository.get_recent_movies(years_back, limit)),
+            years_back,
+            limit,
+            self._catalog_generation(generation)
+        )
 
     def bulk_create_movies(self, movies_data: List[MovieCreate]) -> List[Movie]:
         """Create multiple movies with validation."""
@@ -177,38 +452,347 @@ class MovieService:
             except ValueError as e:
                 raise ValueError(f"Invalid data for movie at index {i}: {str(e)}")
         
-        # Check for duplicates within the batch
-        titles_years = []
+        self.repository.use_primary()
+        conflicts = self.find_bulk_conflicts(movies_data)
+        if conflicts:
+            conflict = conflicts[0]
+            if conflict.reason == "duplicate_in_batch":
+                raise ValueError(f"Duplicate movie in batch: '{conflict.series_title}' ({conflict.released_year})")
+            raise ValueError(f"Movie '{conflict.series_title}' ({conflict.released_year}) already exists")
+        
+        movies = self.repository.bulk_create_movies(movies_data)
+        self._invalidate_caches()
+        return movies
+
+    def bulk_import_movies(self, movies_data: List[MovieCreate]) -> MovieBulkResult:
+        """Create every non-conflicting movie and report the conflicting rows."""
+        if not movies_data:
+            raise ValueError("Movies data list cannot be empty")
+        
+        if len(movies_data) > 5000:
+            raise ValueError("Cannot import more than 5000 movies at once")
+        
+        for i, movie_data in enumerate(movies_data):
+            try:
+                self._validate_movie_data(movie_data)
+            except ValueError as e:
+                raise ValueError(f"Invalid data for movie at index {i}: {str(e)}")
+        
+        self.repository.use_primary()
+        conflicts = self.find_bulk_conflicts(movies_data)
+        conflicting = {conflict.index for conflict in conflicts}
+        to_create = [movie for i, movie in enumerate(movies_data) if i not in conflicting]
+        
+        created = self.repository.bulk_create_movies(to_create) if to_create else []
+        if created:
+            self._invalidate_caches()
+        return MovieBulkResult(
+            created=[MovieRead.model_validate(movie) for movie in created],
+            conflicts=conflicts
+        )
+
+    def bulk_upsert_movies(self, movies_data: List[MovieCreate]) -> MovieBulkWriteResult:
+        """Insert or update movies matched on normalized title and release year."""
+        if not movies_data:
+            raise ValueError("Movies data list cannot be empty")
+        
+        if len(movies_data) > 5000:
+            raise ValueError("Cannot upsert more than 5000 movies at once")
+        
+        for i, movie_data in enumerate(movies_data):
+            try:
+                self._validate_movie_data(movie_data)
+                if movie_data.released_year is None:
+                    raise ValueError("Release year is required to match existing movies")
+            except ValueError as e:
+                raise ValueError(f"Invalid data for movie at index {i}: {str(e)}")
+        
+        seen = set()
         for movie_data in movies_data:
-            title_year = (movie_data.series_title, movie_data.released_year)
-            if title_year in titles_years:
+            key = (normalize_key(movie_data.series_title), movie_data.released_year)
+            if key in seen:
                 raise ValueError(f"Duplicate movie in batch: '{movie_data.series_title}' ({movie_data.released_year})")
-            titles_years.append(title_year)
-        
-        return self.repository.bulk_create_movies(movies_data)
-
-    def get_movie_statistics(self) -> dict:
-        """Get comprehensive movie statistics."""
-        total_count = self.get_movies_count()
-        top_movies = self.get_top_rated_movies(limit=5)
-        recent_movies = self.get_recent_movies(years_back=1, limit=5)
-        
-        return {
-            "total_movies": total_count,
-            "top_rated_movies": [
-                {
-                    "title": movie.series_title,
-                    "rating": movie.imdb_rating,
-                    "year": movie.released_year
-                } for movie in top_movies
-            ],
-            "recent_movies": [
-                {
-                    "title": movie.series_title,
-                    "year": movie.released_year
-                } for movie in recent_movies
-            ]
-        }
+            seen.add(key)
+        
+        affected = self.repository.bulk_upsert_movies(movies_data)
+        self._invalidate_caches()
+        return MovieBulkWriteResult(affected=affected)
+
+    def bulk_update_movies(self, patches: List[MoviePatch]) -> MovieBulkWriteResult:
+        """Apply partial updates to many movies by id in one transaction."""
+        if not patches:
+            raise ValueError("Patch list cannot be empty")
+        
+        if len(patches) > 5000:
+            raise ValueError("Cannot update more than 5000 movies at once")
+        
+        seen_ids = set()
+        for i, patch in enumerate(patches):
+            if patch.id <= 0:
+                raise ValueError(f"Invalid patch at index {i}: Movie ID must be a positive integer")
+            if patch.id in seen_ids:
+                raise ValueError(f"Duplicate movie ID in batch: {patch.id}")
+            seen_ids.add(patch.id)
+            try:
+                self._validate_movie_update_data(patch)
+            except ValueError as e:
+                raise ValueError(f"Invalid patch at index {i}: {str(e)}")
+        
+        self.repository.use_primary()
+        affected, missing_ids = self.repository.bulk_update_movies(
+            [(patch.id, patch.model_dump(exclude_unset=True, exclude={"id"})) for patch in patches]
+        )
+        if affected:
+            self._invalidate_caches()
+        return MovieBulkWriteResult(affected=affected, missing_ids=missing_ids)
+
+    def find_bulk_conflicts(self, movies_data: Sequence[MovieCreate]) -> List[MovieConflict]:
+        """Report rows duplicated within the batch or already stored, in one database check."""
+        return [
+            MovieConflict(
+                index=i,
+                series_title=movies_data[i].series_title,
+                released_year=movies_data[i].released_year,
+                reason=reason
+            )
+            for i, reason in self._title_year_conflicts(
+                [(movie.series_title, movie.released_year) for movie in movies_data]
+            )
+        ]
+
+    def export_movies(
+        self,
+        export_format: str = "ndjson",
+        genre: Optional[str] = None,
+        year: Optional[int] = None,
+        min_rating: Optional[float] = None,
+        director: Optional[str] = None,
+        actor: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> Iterator[str]:
+        """Stream every movie matching the filters as NDJSON or CSV text chunks.
+
+        Arguments are validated before the first chunk is produced, so errors
+        surface before a response has started.
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Export format must be one of: {', '.join(EXPORT_FORMATS)}")
+        
+        if batch_size <= 0 or batch_size > 10000:
+            raise ValueError("Batch size must be between 1 and 10000")
+        
+        self._validate_filters(genre, year, min_rating, director, actor)
+        
+        fields = [name for name in MovieRead.model_fields if name in Movie.__table__.c]
+        rows = self.repository.stream_movies(
+            fields,
+            genre=genre.strip() if genre else None,
+            year=year,
+            min_rating=min_rating,
+            director=director.strip() if director else None,
+            actor=actor.strip() if actor else None,
+            batch_size=batch_size
+        )
+        if export_format == "csv":
+            return csv_chunks(rows)
+        return ndjson_chunks(rows, fields)
+
+    def import_movies_csv(
+        self,
+        path: str,
+        chunk_size: int = 5000,
+        on_progress: Optional[Callable[[IngestReport], None]] = None,
+        skip_existing: bool = True
+    ) -> IngestReport:
+        """Stream a movies CSV into the database in chunks, skipping invalid rows.
+
+        With `skip_existing`, rows whose title and year are repeated in the
+        chunk or already stored are rejected using one lookup per chunk.
+        """
+        if chunk_size <= 0 or chunk_size > 50000:
+            raise ValueError("Chunk size must be between 1 and 50000")
+        
+        self.repository.use_primary()
+        report = IngestReport()
+        started = time.perf_counter()
+        chunk: List[Tuple[int, dict]] = []
+        
+        def flush() -> None:
+            if skip_existing:
+                conflicts = dict(self._title_year_conflicts(
+                    [(values["series_title"], values["released_year"]) for _, values in chunk]
+                ))
+                for i, reason in conflicts.items():
+                    line_number, values = chunk[i]
+                    report.reject(line_number, f"{reason.replace('_', ' ')}: '{values['series_title']}'")
+                rows = [values for i, (_, values) in enumerate(chunk) if i not in conflicts]
+            else:
+                rows = [values for _, values in chunk]
+            report.rows_inserted += self.repository.insert_movie_rows(rows)
+            report.elapsed_seconds = time.perf_counter() - started
+            chunk.clear()
+            if on_progress:
+                on_progress(report)
+        
+        try:
+            for line_number, values in read_movie_csv(path):
+                report.rows_read += 1
+                try:
+                    self._validate_movie_data(MovieCreate.model_construct(**values))
+                except ValueError as e:
+                    report.reject(line_number, str(e))
+                    continue
+                
+                chunk.append((line_number, values))
+                if len(chunk) >= chunk_size:
+                    flush()
+            
+            if chunk:
+                flush()
+        finally:
+            if report.rows_inserted:
+                self._invalidate_caches()
+        
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    def get_movie_statistics(self, top_n: int = STATISTICS_TOP_N, generation: Optional[int] = None) -> dict:
+        """Get catalog statistics, served from the materialized snapshot while it is current.
+
+        Pass the catalog `generation` an ETag was built from to key the cached
+        payload on it, so the body always matches the ETag.
+        """
+        if top_n <= 0 or top_n > 20:
+            raise ValueError("Top N must be between 1 and 20")
+        
+        generation = self._catalog_generation(generation)
+        return self._cached(
+            "get_movie_statistics",
+            lambda: self._compute_movie_statistics(top_n, generation),
+            top_n,
+            generation
+        )
+
+    def refresh_statistics_snapshot(self, force: bool = False) -> bool:
+        """Recompute the snapshot if a write has made it stale; returns whether it was rebuilt."""
+        generation = self.repository.get_catalog_generation()
+        snapshot = self.repository.get_statistics_snapshot()
+        if not force and snapshot is not None and snapshot.generation == generation:
+            return False
+        self._store_statistics_snapshot(generation)
+        return True
+
+    def cache_stats(self) -> dict:
+        """Hit, miss and eviction counters for tuning the caches."""
+        stats = self.query_cache.stats() if self.query_cache is not None else {}
+        if self.single_flight is not None:
+            stats["single_flight"] = self.single_flight.stats()
+        return stats
+
+    def _compute_movie_statistics(self, top_n: int, generation: int) -> dict:
+        # The snapshot, the cache key and the payload stamp all use the one
+        # database generation the caller read, never a process-local counter.
+        # Only the default shape is materialized; other sizes are computed live
+        if not self.use_statistics_snapshot or top_n != STATISTICS_TOP_N:
+            return self._with_stamp(self.repository.compute_statistics(top_n), generation)
+        
+        snapshot = self.repository.get_statistics_snapshot()
+        if snapshot is not None and snapshot.generation == generation:
+            return snapshot.payload
+        return self._store_statistics_snapshot(generation)
+
+    def _store_statistics_snapshot(self, generation: int) -> dict:
+        # Read the generation before computing: a write racing the computation
+        # leaves the snapshot tagged older than its data, so it is rebuilt again.
+        payload = self._with_stamp(self.repository.compute_statistics(STATISTICS_TOP_N), generation)
+        self.repository.save_statistics_snapshot(generation, payload)
+        return payload
+
+    def _with_stamp(self, payload: dict, generation: Optional[int]) -> dict:
+        payload["generation"] = generation
+        payload["computed_at"] = utcnow().isoformat()
+        return payload
+
+    def build_page(
+        self,
+        movies: FinderResult,
+        limit: int,
+        keyset: Keyset = BY_ID,
+        fields: Optional[Sequence[str]] = None,
+        raw: bool = False
+    ) -> Union[MoviePage, MovieSparsePage, Dict[str, Any]]:
+        """Wrap a finder result, or its (rows, total), in a page envelope carrying the next cursor.
+
+        With `raw`, the finder was projected and the page is returned as plain data.
+        """
+        movies, total = split_total(movies)
+        build = raw_page if raw else movie_page
+        return build(movies, next_cursor(movies, limit, keyset), fields, total)
+
+    def build_search_page(
+        self,
+        movies: FinderResult,
+        offset: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        raw: bool = False
+    ) -> Union[MoviePage, MovieSparsePage, Dict[str, Any]]:
+        """Wrap search results, or their (rows, total), in a page envelope carrying the next cursor."""
+        movies, total = split_total(movies)
+        build = raw_page if raw else movie_page
+        return build(
+            movies, self.repository.next_search_cursor(movies, offset, limit, cursor), fields, total
+        )
+
+    def _title_year_conflicts(self, title_years: List[Tuple[str, Optional[int]]]) -> List[Tuple[int, str]]:
+        """Return (index, reason) for pairs repeated in the list or already in the database."""
+        keys = [(normalize_key(title), year) for title, year in title_years]
+        existing = self.repository.find_existing_title_years(keys)
+        
+        seen = set()
+        conflicts = []
+        for i, key in enumerate(keys):
+            if key in seen:
+                conflicts.append((i, "duplicate_in_batch"))
+            elif key in existing:
+                conflicts.append((i, "already_exists"))
+            seen.add(key)
+        return conflicts
+
+    def _cached(self, method: str, loader: Callable[[], Any], *args: Any) -> Any:
+        """Serve a read through the query cache when one is configured.
+
+        With single-flight, concurrent misses for the same call share one load.
+        """
+        if self.single_flight is not None:
+            if self.query_cache is not None:
+                key = self.query_cache.make_key(method, *args)
+            else:
+                key = call_key(method, *args)
+            loader = partial(self.single_flight.do, key, loader, f"MovieService.{method}")
+        if self.query_cache is None:
+            return loader()
+        return self.query_cache.get_or_load(method, loader, *args)
+
+    def _catalog_generation(self, generation: Optional[int]) -> int:
+        """The caller's catalog generation, else the database's.
+
+        Catalog-wide cached reads embed it in their key: the process-local
+        cache generation only moves with this process's own writes.
+        """
+        return self.repository.get_catalog_generation() if generation is None else generation
+
+    def _snapshot(self, result):
+        """Detach ORM results into MovieRead copies that are safe to share via the cache."""
+        if self.query_cache is None and self.single_flight is None:
+            return result
+        return detach_movies(result)
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached reads and aggregates after a write."""
+        if self.query_cache is not None:
+            self.query_cache.bump_generation()
 
     # Private validation methods
     def _validate_movie_data(self, movie_data: MovieCreate) -> None:
@@ -239,10 +823,45 @@ class MovieService:
         if movie_update.meta_score and (movie_update.meta_score < 0 or movie_update.meta_score > 100):
             raise ValueError("Meta score must be between 0 and 100")
 
-    def _validate_pagination(self, offset: int, limit: int) -> None:
+    def _validate_filters(
+        self,
+        genre: Optional[str] = None,
+        year: Optional[int] = None,
+        min_rating: Optional[float] = None,
+        director: Optional[str] = None,
+        actor: Optional[str] = None
+    ) -> None:
+        """Validate the filters shared by filtered listings and exports."""
+        if genre and len(genre.strip()) < 2:
+            raise ValueError("Genre must be at least 2 characters long")
+        
+        if year and (year < 1888 or year > 2030):
+            raise ValueError("Year must be between 1888 and 2030")
+        
+        if min_rating and (min_rating < 0 or min_rating > 10):
+            raise ValueError("Rating must be between 0 and 10")
+        
+        if director and len(director.strip()) < 2:
+            raise ValueError("Director name must be at least 2 characters long")
+        
+        if actor and len(actor.strip()) < 2:
+            raise ValueError("Actor name must be at least 2 characters long")
+
+    def _validate_range(self, name: str, minimum: Optional[int], maximum: Optional[int]) -> None:
+        """Validate an optional non-negative [minimum, maximum] range."""
+        if (minimum is not None and minimum < 0) or (maximum is not None and maximum < 0):
+            raise ValueError(f"{name} bounds must be non-negative")
+        
+        if minimum is not None and maximum is not None and minimum > maximum:
+            raise ValueError(f"Minimum {name.lower()} cannot be greater than maximum {name.lower()}")
+
+    def _validate_pagination(self, offset: int, limit: int, cursor: Optional[str] = None) -> None:
         """Validate pagination parameters."""
         if offset < 0:
             raise ValueError("Offset must be non-negative")
         
+        if cursor and offset:
+            raise ValueError("Use either offset or cursor pagination, not both")
+        
         if limit <= 0 or limit > 1000:
             raise ValueError("Limit must be between 1 and 1000")
\ No newline at end of file
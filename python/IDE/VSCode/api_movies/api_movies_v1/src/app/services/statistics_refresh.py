@@ -0,0 +1,33 @@
+"""
+Background refresh of the materialized statistics snapshot.
+
+Enabled by setting STATS_REFRESH_SECONDS; the snapshot is then rebuilt
+off the request path shortly after writes instead of by the first reader.
+"""
+import asyncio
+import logging
+import os
+
+from sqlmodel import Session
+
+from ..db.database import engine
+from .movie_service import MovieService
+
+logger = logging.getLogger(__name__)
+
+STATS_REFRESH_SECONDS = float(os.getenv("STATS_REFRESH_SECONDS", "0"))
+
+def refresh_statistics_once() -> bool:
+    """Rebuild the snapshot if it is stale; returns whether it was rebuilt."""
+    with Session(engine, expire_on_commit=False) as session:
+        return MovieService(session).refresh_statistics_snapshot()
+
+async def refresh_statistics_periodically(interval_seconds: float = STATS_REFRESH_SECONDS) -> None:
+    """Check the snapshot every `interval_seconds` until cancelled."""
+    while True:
+        try:
+            if await asyncio.to_thread(refresh_statistics_once):
+                logger.info("Statistics snapshot refreshed")
+        except Exception:
+            logger.exception("Statistics snapshot refresh failed")
+        await asyncio.sleep(interval_seconds)
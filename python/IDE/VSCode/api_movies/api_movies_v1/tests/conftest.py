@@ -0,0 +1,90 @@
+"""
+Shared fixtures: a throwaway SQLite catalog per test and an API client bound to it.
+
+Run with `python -m pytest tests` from the project root.
+"""
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from typing import Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+import src.app.repositories.search  # noqa: F401  (registers the full-text index listener)
+from src.app.models.movie import MovieCreate
+from src.app.services.movie_service import MovieService
+
+SAMPLE_MOVIES = [
+    MovieCreate(
+        series_title="The Godfather", released_year=1972, certificate="A", runtime="175 min",
+        genre="Crime, Drama", imdb_rating=9.2, overview="An organized crime dynasty's aging patriarch.",
+        director="Francis Ford Coppola", star1="Marlon Brando", star2="Al Pacino", no_of_votes=1620367,
+        gross="134,966,411"
+    ),
+    MovieCreate(
+        series_title="Heat", released_year=1995, runtime="170 min", genre="Action, Crime, Drama",
+        imdb_rating=8.2, overview="A group of high-end professional thieves.", director="Michael Mann",
+        star1="Al Pacino", star2="Robert De Niro", gross="67,436,818"
+    ),
+    MovieCreate(
+        series_title="Alien", released_year=1979, runtime="117 min", genre="Horror, Sci-Fi",
+        imdb_rating=8.4, overview="The crew of a commercial spacecraft.", director="Ridley Scott",
+        star1="Sigourney Weaver", gross="78,900,000"
+    ),
+    MovieCreate(
+        series_title="Arrival", released_year=2016, runtime="116 min", genre="Drama, Sci-Fi",
+        imdb_rating=7.6, overview="A linguist works with the military.", director="Denis Villeneuve",
+        star1="Amy Adams", gross="100,546,139"
+    ),
+    MovieCreate(
+        series_title="Nosferatu", released_year=1922, runtime="94 min", genre="Fantasy, Horror",
+        imdb_rating=7.9, overview="Vampire Count Orlok expresses interest in a new residence.",
+        director="F.W. Murnau", star1="Max Schreck"
+    ),
+]
+
+
+@pytest.fixture
+def engine(tmp_path) -> Iterator[Engine]:
+    db_engine = create_engine(f"sqlite:///{tmp_path / 'movies.db'}")
+    SQLModel.metadata.create_all(db_engine)
+    yield db_engine
+    db_engine.dispose()
+
+
+@pytest.fixture
+def session(engine) -> Iterator[Session]:
+    with Session(engine, expire_on_commit=False) as db_session:
+        yield db_session
+
+
+@pytest.fixture
+def movies(engine) -> List[int]:
+    """Load SAMPLE_MOVIES; returns their ids in SAMPLE_MOVIES order."""
+    with Session(engine, expire_on_commit=False) as db_session:
+        return [movie.id for movie in MovieService(db_session).bulk_create_movies(SAMPLE_MOVIES)]
+
+
+@pytest.fixture
+def client(engine) -> Iterator[TestClient]:
+    """API client whose request sessions use the test catalog, with empty shared caches."""
+    from main import app
+    from src.app.api.movies import movie_query_cache
+    from src.app.db.database import get_session
+
+    def test_session() -> Iterator[Session]:
+        with Session(engine, expire_on_commit=False) as db_session:
+            yield db_session
+
+    movie_query_cache.clear()
+    app.dependency_overrides[get_session] = test_session
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+        movie_query_cache.clear()
@@ -0,0 +1,18 @@
+"""
+Batch fetch-by-ids: one IN query, results in the caller's order, unknown ids reported.
+"""
+
+
+def test_by_ids_keeps_caller_order_and_reports_missing(client, movies):
+    response = client.post("/api/v1/movies/by-ids", json=[movies[3], 999999, movies[0], movies[3]])
+
+    body = response.json()
+    assert [movie["series_title"] for movie in body["items"]] == ["Arrival", "The Godfather"]
+    assert body["missing_ids"] == [999999]
+
+
+def test_by_ids_rejects_non_positive_ids(client, movies):
+    response = client.post("/api/v1/movies/by-ids", json=[movies[0], 0])
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Movie IDs must be positive integers"
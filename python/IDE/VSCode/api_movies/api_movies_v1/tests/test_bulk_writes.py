@@ -0,0 +1,59 @@
+"""
+Bulk upsert (PUT /bulk) and bulk patch (PATCH /bulk) only write the fields a row sends.
+"""
+from sqlmodel import select
+
+from src.app.models.movie import Movie
+
+
+def stored(session, movie_id: int) -> Movie:
+    session.expire_all()
+    return session.exec(select(Movie).where(Movie.id == movie_id)).one()
+
+
+def test_upsert_updates_only_the_fields_sent(client, session, movies):
+    response = client.put("/api/v1/movies/bulk", json=[
+        {"series_title": "the godfather", "released_year": 1972, "genre": "Crime, Drama", "imdb_rating": 9.3,
+         "runtime": "177 min"},
+        {"series_title": "Blade Runner", "released_year": 1982, "genre": "Sci-Fi"},
+    ])
+
+    assert response.status_code == 200
+    assert response.json()["affected"] == 2
+    godfather = stored(session, movies[0])
+    assert (godfather.imdb_rating, godfather.runtime_minutes, godfather.version) == (9.3, 177, 2)
+    # Fields the row left out keep their stored values
+    assert (godfather.director, godfather.gross_usd, godfather.star2) == ("Francis Ford Coppola", 134966411, "Al Pacino")
+    assert session.exec(select(Movie).where(Movie.series_title == "Blade Runner")).one().genre == "Sci-Fi"
+
+
+def test_upsert_requires_a_release_year(client, movies):
+    response = client.put("/api/v1/movies/bulk", json=[{"series_title": "Heat", "genre": "Crime"}])
+
+    assert response.status_code == 400
+    assert "Release year is required" in response.json()["detail"]
+
+
+def test_patch_reports_missing_ids_and_keeps_unsent_fields(client, session, movies):
+    response = client.patch("/api/v1/movies/bulk", json=[
+        {"id": movies[1], "gross": "70,000,000"},
+        {"id": 999999, "imdb_rating": 1.0},
+    ])
+
+    assert response.json() == {"affected": 1, "missing_ids": [999999]}
+    heat = stored(session, movies[1])
+    assert (heat.gross_usd, heat.imdb_rating, heat.version) == (70000000, 8.2, 2)
+
+
+def test_bulk_import_creates_clean_rows_and_reports_conflicts(client, movies):
+    response = client.post("/api/v1/movies/bulk", json=[
+        {"series_title": "HEAT", "released_year": 1995, "genre": "Crime"},
+        {"series_title": "Blade Runner", "released_year": 1982, "genre": "Sci-Fi"},
+        {"series_title": "blade runner", "released_year": 1982, "genre": "Sci-Fi"},
+    ])
+
+    body = response.json()
+    assert [movie["series_title"] for movie in body["created"]] == ["Blade Runner"]
+    assert [(conflict["index"], conflict["reason"]) for conflict in body["conflicts"]] == [
+        (0, "already_exists"), (2, "duplicate_in_batch")
+    ]
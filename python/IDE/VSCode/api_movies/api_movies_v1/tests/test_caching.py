@@ -0,0 +1,43 @@
+"""
+Cached reads are keyed on the database catalog generation, so a write by
+any worker invalidates them.
+"""
+from sqlmodel import Session
+
+from src.app.core.cache import QueryCache
+from src.app.models.movie import MovieCreate
+from src.app.services.movie_service import MovieService
+
+
+def test_movies_count_is_cached_until_any_worker_writes(engine, movies):
+    cache = QueryCache()
+    with Session(engine) as session:
+        service = MovieService(session, query_cache=cache)
+        assert service.get_movies_count() == len(movies)
+        assert service.get_movies_count() == len(movies)
+    assert cache.stats()["hits"] == 1
+
+    # Another worker writes without touching this process's cache
+    with Session(engine) as session:
+        MovieService(session).create_movie(MovieCreate(series_title="Blade Runner", released_year=1982, genre="Sci-Fi"))
+
+    with Session(engine) as session:
+        assert MovieService(session, query_cache=cache).get_movies_count() == len(movies) + 1
+
+
+def test_top_rated_and_recent_follow_writes_by_other_workers(engine, movies):
+    cache = QueryCache()
+    with Session(engine) as session:
+        service = MovieService(session, query_cache=cache)
+        assert service.get_top_rated_movies(1)[0].series_title == "The Godfather"
+        assert service.get_recent_movies(50, 1)[0].series_title == "Arrival"
+
+    with Session(engine) as session:
+        MovieService(session).create_movie(
+            MovieCreate(series_title="Oppenheimer", released_year=2023, genre="Drama", imdb_rating=9.5)
+        )
+
+    with Session(engine) as session:
+        service = MovieService(session, query_cache=cache)
+        assert service.get_top_rated_movies(1)[0].series_title == "Oppenheimer"
+        assert service.get_recent_movies(50, 1)[0].series_title == "Oppenheimer"
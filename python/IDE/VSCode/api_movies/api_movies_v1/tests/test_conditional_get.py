@@ -0,0 +1,37 @@
+"""
+Conditional GETs: validators match the body served, and any write changes them.
+"""
+
+
+def test_list_revalidates_until_the_catalog_changes(client, movies):
+    first = client.get("/api/v1/movies/")
+    etag = first.headers["ETag"]
+
+    assert client.get("/api/v1/movies/", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/api/v1/movies/", json={"series_title": "Blade Runner", "released_year": 1982, "genre": "Sci-Fi"})
+    changed = client.get("/api/v1/movies/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_movie_revalidates_on_its_version(client, movies):
+    first = client.get(f"/api/v1/movies/{movies[0]}")
+
+    assert first.headers["ETag"] == f'"movie-{movies[0]}-v1"'
+    assert client.get(
+        f"/api/v1/movies/{movies[0]}", headers={"If-Modified-Since": first.headers["Last-Modified"]}
+    ).status_code == 304
+
+    client.patch("/api/v1/movies/bulk", json=[{"id": movies[0], "imdb_rating": 9.3}])
+    updated = client.get(f"/api/v1/movies/{movies[0]}", headers={"If-None-Match": first.headers["ETag"]})
+    assert updated.status_code == 200
+    assert (updated.headers["ETag"], updated.json()["imdb_rating"]) == (f'"movie-{movies[0]}-v2"', 9.3)
+
+
+def test_not_modified_carries_the_etag(client, movies):
+    etag = client.get("/api/v1/movies/statistics").headers["ETag"]
+    response = client.get("/api/v1/movies/statistics", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
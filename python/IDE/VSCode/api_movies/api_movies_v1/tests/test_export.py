@@ -0,0 +1,39 @@
+"""
+Streaming export: `format=` picks NDJSON or CSV, and filters apply as on listings.
+"""
+import csv
+import io
+import json
+
+import pytest
+from sqlmodel import Session
+
+from src.app.api import movies as movies_api
+
+
+@pytest.fixture
+def export_client(client, engine, monkeypatch):
+    """The export opens its own session outside the request; point it at the test catalog."""
+    monkeypatch.setattr(movies_api, "create_session", lambda: Session(engine))
+    return client
+
+
+def test_ndjson_is_the_default(export_client, movies):
+    response = export_client.get("/api/v1/movies/export", params={"genre": "Horror"})
+
+    assert response.headers["content-disposition"] == 'attachment; filename="movies.ndjson"'
+    titles = [json.loads(line)["series_title"] for line in response.text.splitlines()]
+    assert sorted(titles) == ["Alien", "Nosferatu"]
+
+
+def test_csv_export(export_client, movies):
+    response = export_client.get("/api/v1/movies/export", params={"format": "csv", "min_rating": 8.3})
+
+    assert response.headers["content-disposition"] == 'attachment; filename="movies.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    # IMDb-style headers, so the file loads back through the ingest command
+    assert sorted(row["Series_Title"] for row in rows) == ["Alien", "The Godfather"]
+
+
+def test_unknown_format_is_rejected(export_client, movies):
+    assert export_client.get("/api/v1/movies/export", params={"format": "xml"}).status_code == 422
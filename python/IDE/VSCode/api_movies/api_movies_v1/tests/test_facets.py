@@ -0,0 +1,32 @@
+"""
+Facet counts: each facet ignores its own filter, and ratings fall into whole-star buckets.
+"""
+from sqlalchemy.dialects import postgresql
+
+from src.app.repositories.facets import facet_statement
+
+
+def facet(body: dict, name: str) -> dict:
+    return {item["value"]: item["count"] for item in body["facets"][name]}
+
+
+def test_ratings_are_floored_into_whole_star_buckets(client, movies):
+    body = client.get("/api/v1/movies/facets").json()
+
+    # Arrival (7.6) and Nosferatu (7.9) both land in 7, not 8
+    assert facet(body, "rating") == {"7": 2, "8": 2, "9": 1}
+
+
+def test_rating_bucket_floors_before_casting_on_postgresql():
+    sql = str(facet_statement(lambda facet: []).compile(dialect=postgresql.dialect()))
+
+    assert "CAST(floor(movie.imdb_rating) AS INTEGER)" in sql
+
+
+def test_each_facet_counts_without_its_own_filter(client, movies):
+    body = client.get("/api/v1/movies/facets", params={"genre": "Horror"}).json()
+
+    assert body["total"] == 2
+    assert facet(body, "genre") == {"Drama": 3, "Crime": 2, "Horror": 2, "Sci-Fi": 2, "Action": 1, "Fantasy": 1}
+    assert facet(body, "decade") == {"1920": 1, "1970": 1}
+    assert facet(body, "rating") == {"7": 1, "8": 1}
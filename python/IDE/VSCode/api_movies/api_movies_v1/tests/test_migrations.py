@@ -0,0 +1,67 @@
+"""
+Upgrading a database created before migrations existed backfills the new schema from its rows.
+"""
+import sqlite3
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlmodel import Session, create_engine
+
+from src.app.db.database import ALEMBIC_INI
+from src.app.models.movie import MovieCreate
+from src.app.services.movie_service import MovieService
+
+
+def migrate(engine, revision: str, action=command.upgrade) -> None:
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "migrations"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        action(config, revision)
+
+
+@pytest.fixture
+def old_database(tmp_path):
+    """A database at revision 0001 holding rows written by the original app."""
+    path = tmp_path / "old.db"
+    engine = create_engine(f"sqlite:///{path}")
+    migrate(engine, "0001")
+    with sqlite3.connect(path) as connection:
+        connection.executemany(
+            "INSERT INTO movie (series_title, released_year, runtime, genre, overview, star1, gross) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                ("The Godfather", 1972, "175 min", "Crime, Drama", "An organized crime dynasty.", "Al Pacino", "134,966,411"),
+                ("Heat", 1995, "170 min", "Action, Crime", "Professional thieves.", "Al Pacino", None),
+            ],
+        )
+    yield engine, path
+    engine.dispose()
+
+
+def test_upgrade_backfills_existing_rows(old_database):
+    engine, _ = old_database
+    migrate(engine, "head")
+
+    with Session(engine) as session:
+        service = MovieService(session)
+        assert [movie.series_title for movie in service.get_movies_by_actor("al pacino")] == ["The Godfather", "Heat"]
+        assert [movie.series_title for movie in service.get_movies_by_genre("Action")] == ["Heat"]
+        assert [movie.series_title for movie in service.search_movies("dynasty")] == ["The Godfather"]
+        godfather = service.get_movies_by_multiple_filters(sort="gross", limit=5)[0]
+        assert (godfather.title_key, godfather.runtime_minutes, godfather.gross_usd) == ("the godfather", 175, 134966411)
+        with pytest.raises(ValueError, match="already exists"):
+            service.create_movie(MovieCreate(series_title="the  GODFATHER", released_year=1972, genre="Crime"))
+
+
+def test_upgrade_stops_before_changing_a_catalog_with_duplicates(old_database):
+    engine, path = old_database
+    with sqlite3.connect(path) as connection:
+        connection.execute("INSERT INTO movie (series_title, released_year, genre) VALUES ('HEAT ', 1995, 'Crime')")
+
+    with pytest.raises(RuntimeError, match="'HEAT ' \\(1995\\)"):
+        migrate(engine, "head")
+    with sqlite3.connect(path) as connection:
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(movie)")]
+    assert "title_key" not in columns
@@ -0,0 +1,99 @@
+"""
+Keyset cursors: walking every page of a sort returns each movie once, in order.
+"""
+import base64
+import json
+
+import pytest
+from sqlmodel import select
+
+from src.app.models.movie import Movie
+from src.app.repositories.pagination import SORT_KEYSETS, InvalidCursorError, decode_cursor
+from src.app.services.movie_service import MovieService
+
+
+def forged_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def walk(service: MovieService, sort: str, limit: int = 2) -> list:
+    """Ids of every page of a filtered listing, following next cursors."""
+    keyset = SORT_KEYSETS[sort]
+    ids, cursor = [], None
+    while True:
+        page = service.build_page(
+            service.get_movies_by_multiple_filters(sort=sort, limit=limit, cursor=cursor), limit, keyset
+        )
+        ids.extend(movie.id for movie in page.items)
+        if page.next_cursor is None:
+            return ids
+        cursor = page.next_cursor
+
+
+@pytest.mark.parametrize("sort", ["id", "rating", "runtime", "gross"])
+def test_cursor_pages_cover_the_sort_in_order(session, movies, sort):
+    keyset = SORT_KEYSETS[sort]
+    rows = session.exec(select(Movie)).all()
+    expected = sorted(
+        (movie for movie in rows if getattr(movie, keyset.fields[0]) is not None),
+        key=lambda movie: tuple(getattr(movie, field) for field in keyset.fields),
+        reverse=keyset.descending,
+    )
+
+    assert walk(MovieService(session), sort) == [movie.id for movie in expected]
+
+
+def test_cursor_from_another_sort_is_rejected(session, movies):
+    service = MovieService(session)
+    page = service.build_page(service.get_all_movies(limit=2), 2)
+
+    with pytest.raises(InvalidCursorError):
+        service.get_movies_by_multiple_filters(sort="rating", limit=2, cursor=page.next_cursor)
+
+
+def test_offset_and_cursor_together_are_rejected(session, movies):
+    service = MovieService(session)
+    page = service.build_page(service.get_all_movies(limit=2), 2)
+
+    with pytest.raises(ValueError, match="not both"):
+        service.get_all_movies(offset=2, limit=2, cursor=page.next_cursor)
+
+
+@pytest.mark.parametrize("payload", [
+    {"k": "id", "v": [{"a": 1}]},
+    {"k": "id", "v": ["7"]},
+    {"k": "id", "v": [True]},
+    {"k": "id", "v": [2 ** 70]},
+    {"k": "id", "v": [1, 2]},
+    {"k": "rating", "v": [None, 3]},
+])
+def test_forged_cursor_values_are_rejected(payload):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(forged_cursor(payload), SORT_KEYSETS[payload["k"]])
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", forged_cursor({"k": "id", "v": ["x"]})])
+def test_bad_cursor_is_a_400(client, movies, cursor):
+    response = client.get("/api/v1/movies/", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] in ("Invalid pagination cursor", "Pagination cursor does not match this listing")
+
+
+def test_gross_pages_skip_movies_without_gross(session, movies):
+    # Nosferatu has no gross, so it sits outside the gross keyset
+    assert walk(MovieService(session), "gross", limit=3) == [movies[0], movies[3], movies[2], movies[1]]
+
+
+@pytest.mark.parametrize("path, params, total", [
+    ("/api/v1/movies/", {}, 5),
+    ("/api/v1/movies/filter", {"genre": "Drama", "sort": "rating"}, 3),
+    ("/api/v1/movies/search", {"q": "crime"}, 1),
+])
+def test_with_total_counts_every_match_not_just_the_page(client, movies, path, params, total):
+    plain = client.get(path, params={**params, "limit": 1}).json()
+    counted = client.get(path, params={**params, "limit": 1, "with_total": True}).json()
+
+    assert plain["total"] is None
+    assert counted["items"] == plain["items"]
+    assert counted["total"] == total
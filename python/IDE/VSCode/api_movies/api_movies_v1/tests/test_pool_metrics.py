@@ -0,0 +1,31 @@
+"""
+Checkout metrics: only pool exhaustion counts as a timeout.
+"""
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.app.db.database import TimedQueuePool
+
+
+def test_exhausted_pool_counts_a_timeout(tmp_path):
+    pool = TimedQueuePool(lambda: sqlite3.connect(tmp_path / "pool.db"), pool_size=1, max_overflow=0, timeout=0.05)
+    held = pool.connect()
+
+    with pytest.raises(PoolTimeoutError):
+        pool.connect()
+    held.close()
+
+    assert (pool.metrics.checkouts, pool.metrics.timeouts, pool.metrics.errors) == (1, 1, 0)
+
+
+def test_failed_connect_is_an_error_not_a_timeout():
+    def refuse():
+        raise sqlite3.OperationalError("connection refused")
+
+    pool = TimedQueuePool(refuse, pool_size=1, max_overflow=0, timeout=0.05)
+
+    with pytest.raises(sqlite3.OperationalError):
+        pool.connect()
+    assert (pool.metrics.timeouts, pool.metrics.errors) == (0, 1)
@@ -0,0 +1,79 @@
+"""
+Read/write routing against a lagging replica.
+
+The replica is a second SQLite file that never receives the primary's
+writes, which is how a replica far behind on replication looks to the
+application. Run with `python -m pytest tests`.
+"""
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, func, select
+
+import src.app.repositories.search  # noqa: F401  (registers the full-text index listener)
+from src.app.db.routing import ReplicaPool, RoutingSession
+from src.app.models.movie import Movie, MovieCreate, MoviePatch
+from src.app.services.movie_service import MovieService
+
+
+@pytest.fixture
+def engines(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for engine in (primary, replica):
+        SQLModel.metadata.create_all(engine)
+    # Written to the primary only: the replica hasn't caught up yet
+    with Session(primary) as session:
+        MovieService(session).bulk_create_movies([
+            MovieCreate(series_title="The Godfather", released_year=1972, genre="Crime, Drama"),
+            MovieCreate(series_title="Nosferatu", genre="Horror"),
+        ])
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def routing_session(primary, replica) -> RoutingSession:
+    return RoutingSession(primary, ReplicaPool([replica]), expire_on_commit=False)
+
+
+def count_movies(session: Session) -> int:
+    return session.exec(select(func.count()).select_from(Movie)).one()
+
+
+def test_reads_use_the_replica_until_the_session_writes(engines):
+    with routing_session(*engines) as session:
+        assert count_movies(session) == 0
+
+        MovieService(session).create_movie(MovieCreate(series_title="Alien", released_year=1979, genre="Horror"))
+        assert count_movies(session) == 3
+
+
+def test_bulk_import_reports_conflicts_seen_on_the_primary(engines):
+    with routing_session(*engines) as session:
+        result = MovieService(session).bulk_import_movies([
+            MovieCreate(series_title="the godfather", released_year=1972, genre="Crime"),
+            MovieCreate(series_title="Alien", released_year=1979, genre="Horror"),
+        ])
+
+    assert [(conflict.index, conflict.reason) for conflict in result.conflicts] == [(0, "already_exists")]
+    assert [movie.series_title for movie in result.created] == ["Alien"]
+
+
+def test_create_rejects_an_undated_duplicate_only_the_primary_has(engines):
+    with routing_session(*engines) as session:
+        with pytest.raises(ValueError, match="already exists"):
+            MovieService(session).create_movie(MovieCreate(series_title="NOSFERATU", genre="Horror"))
+
+
+def test_bulk_update_finds_ids_only_the_primary_has(engines):
+    primary, replica = engines
+    with Session(primary) as session:
+        movie_id = session.exec(select(Movie.id).where(Movie.series_title == "The Godfather")).one()
+
+    with routing_session(primary, replica) as session:
+        result = MovieService(session).bulk_update_movies([MoviePatch(id=movie_id, imdb_rating=9.2)])
+
+    assert (result.affected, result.missing_ids) == (1, [])
@@ -0,0 +1,32 @@
+"""
+Sparse fieldsets: `fields=` returns only the named columns, plus `id`.
+"""
+
+
+def test_listing_returns_only_requested_fields(client, movies):
+    body = client.get("/api/v1/movies/", params={"fields": "series_title,imdb_rating", "limit": 2}).json()
+
+    assert body["items"] == [
+        {"id": movies[0], "series_title": "The Godfather", "imdb_rating": 9.2},
+        {"id": movies[1], "series_title": "Heat", "imdb_rating": 8.2},
+    ]
+
+
+def test_sorted_projection_still_pages_by_its_sort_key(client, movies):
+    first = client.get("/api/v1/movies/filter", params={"sort": "runtime", "fields": "series_title", "limit": 2}).json()
+    second = client.get(
+        "/api/v1/movies/filter",
+        params={"sort": "runtime", "fields": "series_title", "limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+
+    assert [movie["series_title"] for movie in first["items"] + second["items"]] == [
+        "The Godfather", "Heat", "Alien", "Arrival"
+    ]
+    assert set(first["items"][0]) == {"id", "series_title"}
+
+
+def test_unknown_fields_are_a_400(client, movies):
+    response = client.get("/api/v1/movies/", params={"fields": "series_title,password"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Unknown fields: password.")
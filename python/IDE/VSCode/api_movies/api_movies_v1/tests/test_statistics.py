@@ -0,0 +1,30 @@
+"""
+Catalog statistics: one aggregate query, served from a snapshot until the catalog changes.
+"""
+from sqlmodel import Session
+
+from src.app.core.cache import QueryCache
+from src.app.models.movie import MovieCreate
+from src.app.services.movie_service import MovieService
+
+
+def test_statistics_sections(client, movies):
+    stats = client.get("/api/v1/movies/statistics", params={"top_n": 2}).json()
+
+    assert (stats["total_movies"], stats["average_rating"]) == (5, 8.26)
+    assert stats["rating_percentiles"] == {"p50": 8.2, "p90": 9.2, "p99": 9.2}
+    assert stats["movies_by_decade"] == {"1920": 1, "1970": 2, "1990": 1, "2010": 1}
+    assert stats["movies_by_certificate"] == {"unknown": 4, "A": 1}
+    assert [movie["title"] for movie in stats["top_rated_movies"]] == ["The Godfather", "Alien"]
+    assert [movie["title"] for movie in stats["top_rated_by_genre"]["Horror"]] == ["Alien", "Nosferatu"]
+
+
+def test_snapshot_follows_the_catalog_generation(engine, movies):
+    with Session(engine) as session:
+        first = MovieService(session, query_cache=QueryCache()).get_movie_statistics()
+        MovieService(session).create_movie(MovieCreate(series_title="Blade Runner", released_year=1982, genre="Sci-Fi"))
+
+    with Session(engine) as session:
+        second = MovieService(session, query_cache=QueryCache()).get_movie_statistics()
+
+    assert (second["generation"], second["total_movies"]) == (first["generation"] + 1, 6)